@@ -5,5 +5,7 @@ This package exposes LLM-friendly tools backed by a constrained subset of the
 Qortal Core HTTP API. See DESIGN.md for full details.
 """
 
-__all__ = ["config"]
+__version__ = "0.1.0"
+
+__all__ = ["config", "__version__"]
 
@@ -19,6 +19,16 @@ ALLOW_PUBLIC_FALLBACK = os.getenv("QORTAL_ALLOW_PUBLIC_FALLBACK", "false").lower
 FALLBACK_COOLDOWN_SECONDS = float(os.getenv("QORTAL_FALLBACK_COOLDOWN_SECONDS", "30"))
 FALLBACK_HEALTH_CHECK_PATH = os.getenv("QORTAL_FALLBACK_HEALTH_CHECK_PATH", "/blocks/height")
 FALLBACK_HEALTH_CHECK_TIMEOUT = float(os.getenv("QORTAL_FALLBACK_HEALTH_CHECK_TIMEOUT", "2"))
+FALLBACK_HEDGE_AFTER_SECONDS = float(os.getenv("QORTAL_FALLBACK_HEDGE_AFTER_SECONDS", "0.5"))
+
+# In-memory response cache (entries); 0 disables it.
+RESPONSE_CACHE_SIZE = int(os.getenv("QORTAL_RESPONSE_CACHE_SIZE", "256"))
+
+# Optional persistent cache for immutable block/transaction lookups (disabled
+# unless a directory is configured; requires the `diskcache` package).
+DISK_CACHE_DIR = os.getenv("QORTAL_DISK_CACHE_DIR") or None
+DISK_CACHE_SIZE_LIMIT = int(os.getenv("QORTAL_DISK_CACHE_SIZE_LIMIT", str(10 << 30)))
+DISK_CACHE_MIN_CONFIRMATIONS = int(os.getenv("QORTAL_DISK_CACHE_MIN_CONFIRMATIONS", "10"))
 
 
 def _parse_public_nodes(raw: str) -> list[str]:
@@ -45,6 +55,13 @@ def _load_timeout() -> float:
 
 DEFAULT_TIMEOUT = _load_timeout()
 
+# Outbound connection pooling. HTTP/2 is used only when the optional `h2`
+# package is installed and the node is reached over TLS.
+HTTP2_ENABLED = os.getenv("QORTAL_HTTP2", "true").lower() == "true"
+HTTP_MAX_CONNECTIONS = int(os.getenv("QORTAL_HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("QORTAL_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("QORTAL_HTTP_KEEPALIVE_EXPIRY", "60"))
+
 # API key handling
 API_KEY_ENV_VAR = "QORTAL_API_KEY"
 API_KEY_FILE_ENV_VAR = "QORTAL_API_KEY_FILE"
@@ -54,6 +71,7 @@ DEFAULT_API_KEY_FILE = "apikey.txt"
 MAX_NAMES_RETURNED = 100
 MAX_TRADE_OFFERS = 100
 DEFAULT_TRADE_OFFERS = 50
+MAX_TRADE_LEDGER_LINES = 1000
 MAX_QDN_RESULTS = 20
 DEFAULT_QDN_RESULTS = 10
 MAX_NAME_DATA_PREVIEW = 1000
@@ -111,9 +129,14 @@ class QortalConfig:
     base_url: str = DEFAULT_BASE_URL
     timeout: float = DEFAULT_TIMEOUT
     api_key: Optional[str] = load_api_key()
+    http2: bool = HTTP2_ENABLED
+    http_max_connections: int = HTTP_MAX_CONNECTIONS
+    http_max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS
+    http_keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY
     max_names: int = MAX_NAMES_RETURNED
     max_trade_offers: int = MAX_TRADE_OFFERS
     default_trade_offers: int = DEFAULT_TRADE_OFFERS
+    max_trade_ledger_lines: int = MAX_TRADE_LEDGER_LINES
     max_qdn_results: int = MAX_QDN_RESULTS
     default_qdn_results: int = DEFAULT_QDN_RESULTS
     max_name_data_preview: int = MAX_NAME_DATA_PREVIEW
@@ -146,6 +169,11 @@ class QortalConfig:
     fallback_cooldown_seconds: float = FALLBACK_COOLDOWN_SECONDS
     fallback_health_check_path: str = FALLBACK_HEALTH_CHECK_PATH
     fallback_health_check_timeout: float = FALLBACK_HEALTH_CHECK_TIMEOUT
+    fallback_hedge_after_seconds: float = FALLBACK_HEDGE_AFTER_SECONDS
+    response_cache_size: int = RESPONSE_CACHE_SIZE
+    disk_cache_dir: Optional[str] = DISK_CACHE_DIR
+    disk_cache_size_limit: int = DISK_CACHE_SIZE_LIMIT
+    disk_cache_min_confirmations: int = DISK_CACHE_MIN_CONFIRMATIONS
 
 
 default_config = QortalConfig()
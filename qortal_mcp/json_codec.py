@@ -0,0 +1,46 @@
+"""JSON helpers that use `orjson` when installed and the stdlib otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Decode a JSON document.
+
+    Inputs orjson rejects but the stdlib accepts (NaN, integers wider than 64
+    bits) fall through to `json.loads`, so results never depend on which
+    decoder is installed. Invalid JSON raises `ValueError` either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode obj as compact UTF-8 JSON bytes.
+
+    Non-string keys are stringified like the stdlib does, and values orjson
+    cannot encode (integers wider than 64 bits) fall through to `json.dumps`.
+    orjson writes NaN and infinities as `null`; the stdlib fallback rejects
+    them with `ValueError`, as Starlette's `JSONResponse` always has.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
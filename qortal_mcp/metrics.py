@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, deque
 from threading import Lock
-from typing import Dict
+from typing import Deque, Dict, Tuple
+
+# Number of per-request durations kept for the /metrics snapshot.
+RECENT_DURATIONS = 100
 
 
 class MetricsRecorder:
-    def __init__(self) -> None:
+    def __init__(self, recent_durations: int = RECENT_DURATIONS) -> None:
         self._lock = Lock()
         self._requests = 0
-        self._request_durations_ms: Dict[str, float] = {}
+        # Bounded ring of (request_id, duration_ms); the oldest entry drops off
+        # on append, so recording never grows memory or needs an eviction pass.
+        self._request_durations_ms: Deque[Tuple[str, float]] = deque(maxlen=recent_durations)
         self._rate_limited = 0
         self._tool_success: Counter[str] = Counter()
         self._tool_error: Counter[str] = Counter()
@@ -22,7 +27,7 @@ class MetricsRecorder:
 
     def record_duration(self, request_id: str, duration_ms: float) -> None:
         with self._lock:
-            self._request_durations_ms[request_id] = duration_ms
+            self._request_durations_ms.append((request_id, duration_ms))
 
     def incr_rate_limited(self) -> None:
         with self._lock:
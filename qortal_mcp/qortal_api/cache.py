@@ -0,0 +1,165 @@
+"""
+Response caches for Qortal Core lookups.
+
+Only read-only GET responses are cached. The in-memory tier holds a bounded
+LRU of recent responses with per-endpoint TTLs. The persistent tier is
+restricted to endpoints whose payloads cannot change once the referenced block
+is buried deeply enough (blocks, minting info, confirmed transactions).
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping, Optional, Tuple
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+# Paths whose responses are immutable once sufficiently confirmed. The first
+# capture group (when present) is the block height encoded in the path.
+IMMUTABLE_PATTERNS: Tuple[re.Pattern[str], ...] = (
+    re.compile(r"^/blocks/byheight/(\d+)$"),
+    re.compile(r"^/blocks/byheight/(\d+)/mintinginfo$"),
+    re.compile(r"^/blocks/signature/[^/]+$"),
+    re.compile(r"^/transactions/signature/[^/]+$"),
+)
+
+
+# Per-endpoint TTLs (seconds) for the in-memory tier, matched by prefix in
+# order; the first match wins and a TTL of 0 opts a path out. Paths not listed
+# here are never cached in memory. Block lookups use a long but finite TTL so a
+# block orphaned near the tip eventually refreshes. Group membership, invites,
+# join requests and bans stay uncached; group definitions and owner/member
+# listings change rarely enough for a short TTL.
+TTL_RULES: Tuple[Tuple[str, float], ...] = (
+    ("/blocks/first", math.inf),
+    ("/blocks/byheight/", 300.0),
+    ("/blocks/signature/", 300.0),
+    ("/blocks/height", 2.0),
+    ("/blocks/last", 2.0),
+    ("/admin/", 2.0),
+    ("/names/", 10.0),
+    ("/assets/info", 60.0),
+    ("/groups/members/", 0.0),
+    ("/groups/invites/", 0.0),
+    ("/groups/joinrequests/", 0.0),
+    ("/groups/bans/", 0.0),
+    ("/groups/", 30.0),
+)
+
+MISS = object()
+
+
+def response_ttl(path: str) -> float:
+    """Return the in-memory TTL for path, or 0 when it must not be cached."""
+    for prefix, ttl in TTL_RULES:
+        if path.startswith(prefix):
+            return ttl
+    return 0.0
+
+
+def cache_key(path: str, params: Optional[Mapping[str, Any]], use_api_key: bool) -> Tuple[Hashable, ...]:
+    """Build a hashable key from the request path, params and auth flag."""
+    if not params:
+        return (path, (), use_api_key)
+    items = []
+    for name, value in params.items():
+        if isinstance(value, list):
+            value = tuple(value)
+        items.append((name, value))
+    items.sort(key=lambda item: item[0])
+    return (path, tuple(items), use_api_key)
+
+
+class TTLCache:
+    """Bounded LRU of responses with per-entry expiry; values are deep-copied."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of the cached value, or `MISS` when absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISS
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return MISS
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a copy of value for ttl seconds, evicting the oldest entries."""
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def is_immutable_path(path: str) -> bool:
+    """Return True when the path is one of the immutable lookup endpoints."""
+    return any(pattern.match(path) for pattern in IMMUTABLE_PATTERNS)
+
+
+def payload_height(path: str, data: Any) -> Optional[int]:
+    """
+    Determine the block height an immutable response belongs to.
+
+    The height is taken from the path for by-height lookups, otherwise from the
+    `height` (blocks) or `blockHeight` (transactions) field of the payload.
+    Unconfirmed transactions carry no height and are never persisted.
+    """
+    for pattern in IMMUTABLE_PATTERNS:
+        match = pattern.match(path)
+        if match and match.groups():
+            return int(match.group(1))
+    if isinstance(data, dict):
+        for key in ("height", "blockHeight"):
+            value = data.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+    return None
+
+
+class DiskResponseCache:
+    """Thin wrapper around `diskcache.Cache` that never raises on I/O errors."""
+
+    def __init__(self, directory: str, *, size_limit: int) -> None:
+        if diskcache is None:
+            raise RuntimeError("diskcache is not installed")
+        self._cache = diskcache.Cache(directory, size_limit=size_limit)
+
+    def get(self, key: str) -> Any:
+        """Return the cached payload for key, or None on miss or error."""
+        try:
+            return self._cache.get(key)
+        except Exception:
+            logger.warning("Disk cache read failed; treating as miss")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Persist a payload; failures are logged and otherwise ignored."""
+        try:
+            self._cache.set(key, value)
+        except Exception:
+            logger.warning("Disk cache write failed; skipping persistence")
+
+    def close(self) -> None:
+        try:
+            self._cache.close()
+        except Exception:
+            logger.warning("Disk cache close failed")
@@ -7,18 +7,67 @@ tool layer can turn into safe, user-facing messages.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
+import functools
 import logging
+import math
+import re
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
 from urllib.parse import quote
 
 import httpx
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+try:
+    import brotli  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _BROTLI_AVAILABLE = False
+else:
+    _BROTLI_AVAILABLE = True
+
+from qortal_mcp import __version__, json_codec
 from qortal_mcp.config import QortalConfig, default_config
+from qortal_mcp.qortal_api.cache import (
+    MISS,
+    DiskResponseCache,
+    TTLCache,
+    cache_key,
+    diskcache,
+    is_immutable_path,
+    payload_height,
+    response_ttl,
+)
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched chain height is trusted when deciding whether an immutable
+# response is buried deeply enough to persist. A stale height only makes the
+# confirmation check more conservative.
+_CHAIN_HEIGHT_REFRESH_SECONDS = 60.0
+
+# QORT balance lookups are by far the most common balance call; encode their
+# fixed query string once instead of on every request.
+_DEFAULT_BALANCE_PARAMS = httpx.QueryParams({"assetId": 0})
+
+# Advertise compression explicitly; `br` only when httpx can decode it.
+_DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, br" if _BROTLI_AVAILABLE else "gzip",
+    "User-Agent": f"qortal-mcp-server/{__version__}",
+}
+
+# Shared read-only header mapping for the common unauthenticated request.
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
 
 class QortalApiError(Exception):
     """Base exception for Qortal API errors."""
@@ -59,16 +108,229 @@ class NodeUnreachableError(QortalApiError):
     """Raised when the node cannot be reached."""
 
 
+# Query parameter specs: (wire name, drop_falsy) pairs consumed positionally
+# by `_build_params`. `_IS_SET` keeps any value that is not None; `_NON_EMPTY`
+# additionally drops empty strings/lists and False. The modes are plain bools
+# so the per-value check is a truth test rather than a string comparison.
+_IS_SET = False
+_NON_EMPTY = True
+_PAGING_PARAMS = (("limit", _IS_SET), ("offset", _IS_SET), ("reverse", _IS_SET))
+_NAMES_LIST_PARAMS = (("after", _IS_SET), *_PAGING_PARAMS)
+_SEARCH_NAMES_PARAMS = (("prefix", _IS_SET), *_PAGING_PARAMS)
+_TRADE_OFFERS_PARAMS = (("foreignBlockchain", _NON_EMPTY), ("offset", _IS_SET), ("reverse", _IS_SET))
+_COMPLETED_TRADES_PARAMS = (
+    ("foreignBlockchain", _NON_EMPTY),
+    ("minimumTimestamp", _IS_SET),
+    ("buyerPublicKey", _NON_EMPTY),
+    ("sellerPublicKey", _NON_EMPTY),
+    *_PAGING_PARAMS,
+)
+_BLOCK_SUMMARIES_PARAMS = (("count", _IS_SET),)
+_BLOCK_RANGE_PARAMS = (("reverse", _IS_SET), ("includeOnlineSignatures", _IS_SET))
+_SEARCH_TX_PARAMS = (
+    ("startBlock", _IS_SET),
+    ("blockLimit", _IS_SET),
+    ("txType", _NON_EMPTY),
+    ("address", _NON_EMPTY),
+    ("confirmationStatus", _NON_EMPTY),
+    *_PAGING_PARAMS,
+)
+_TX_LIST_PARAMS = (
+    ("limit", _IS_SET),
+    ("offset", _IS_SET),
+    ("confirmationStatus", _NON_EMPTY),
+    ("reverse", _IS_SET),
+)
+_ASSETS_PARAMS = (("includeData", _IS_SET), *_PAGING_PARAMS)
+_GROUP_MEMBERS_PARAMS = (("onlyAdmins", _IS_SET), *_PAGING_PARAMS)
+_HIDDEN_OFFERS_PARAMS = (("foreignBlockchain", _NON_EMPTY),)
+_TRADE_LEDGER_PARAMS = (("minimumTimestamp", _IS_SET),)
+_TRADE_PRICE_PARAMS = (("maxtrades", _IS_SET), ("inverse", _IS_SET))
+_ASSET_INFO_PARAMS = (("assetId", _IS_SET), ("assetName", _NON_EMPTY))
+_CHAT_MESSAGE_PARAMS = (("encoding", _NON_EMPTY),)
+_ACTIVE_CHATS_PARAMS = (("encoding", _NON_EMPTY), ("haschatreference", _IS_SET))
+_ASSET_BALANCES_PARAMS = (
+    ("address", _NON_EMPTY),
+    ("assetId", _NON_EMPTY),
+    ("ordering", _NON_EMPTY),
+    ("excludeZero", _IS_SET),
+    *_PAGING_PARAMS,
+)
+_SEARCH_QDN_PARAMS = (
+    ("address", _NON_EMPTY),
+    ("service", _IS_SET),
+    ("confirmationStatus", _NON_EMPTY),
+    ("startBlock", _IS_SET),
+    ("blockLimit", _IS_SET),
+    ("txGroupId", _IS_SET),
+    ("name", _NON_EMPTY),
+    ("offset", _IS_SET),
+    ("reverse", _IS_SET),
+)
+_CHAT_SEARCH_PARAMS = (
+    ("before", _IS_SET),
+    ("after", _IS_SET),
+    ("txGroupId", _IS_SET),
+    ("involving", _NON_EMPTY),
+    ("reference", _NON_EMPTY),
+    ("chatreference", _NON_EMPTY),
+    ("haschatreference", _IS_SET),
+    ("sender", _NON_EMPTY),
+    ("encoding", _NON_EMPTY),
+    *_PAGING_PARAMS,
+)
+
+
+def _build_params(
+    spec: Tuple[Tuple[str, bool], ...],
+    values: Tuple[Any, ...],
+    base: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Map positional values onto wire names, skipping unset entries.
+
+    The dict is only allocated once an entry is set, so calls without any
+    query arguments return None (or `base` unchanged) and can be passed
+    straight through to `_request`.
+    """
+    params = base
+    for (wire, drop_falsy), value in zip(spec, values):
+        if value is None or (drop_falsy and not value):
+            continue
+        if params is None:
+            params = {}
+        params[wire] = value
+    return params
+
+
+def _paging_params(
+    limit: Optional[int], offset: Optional[int], reverse: Optional[bool]
+) -> Optional[Dict[str, Any]]:
+    return _build_params(_PAGING_PARAMS, (limit, offset, reverse))
+
+
+# Qortal error signals checked in order against the upper-cased error code and
+# message: (signals, lower-case message substring, exception class, message).
+_ERROR_RULES: Tuple[Tuple[frozenset[str], Optional[str], type[QortalApiError], str], ...] = (
+    (
+        frozenset({"INVALID_ADDRESS", "INVALID_QORTAL_ADDRESS", "INVALID_RECIPIENT", "102"}),
+        "invalid address",
+        InvalidAddressError,
+        "Invalid Qortal address.",
+    ),
+    (frozenset({"NAME_UNKNOWN", "401"}), None, NameNotFoundError, "Name not found."),
+    (frozenset({"BLOCK_UNKNOWN", "BLOCK NOT FOUND"}), "block unknown", QortalApiError, "Block not found."),
+    (frozenset({"INVALID_ASSET_ID", "601"}), None, QortalApiError, "Asset not found."),
+    (
+        frozenset({"ADDRESS_UNKNOWN", "UNKNOWN_ADDRESS", "124"}),
+        "unknown address",
+        AddressNotFoundError,
+        "Address not found on chain.",
+    ),
+    (frozenset({"GROUP_UNKNOWN", "1101"}), None, GroupNotFoundError, "Group not found."),
+    (frozenset({"INVALID_PUBLIC_KEY"}), "invalid public key", QortalApiError, "Invalid public key."),
+    (frozenset({"INVALID_DATA"}), "invalid data", QortalApiError, "Qortal API error."),
+)
+
+# Characters `quote(..., safe="")` never escapes; Base58 addresses, signatures
+# and most names consist only of these and can skip encoding entirely.
+_URL_SAFE = re.compile(r"[A-Za-z0-9_.~-]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_path(segment: str) -> str:
+    """Percent-encode a single path segment, memoizing repeated identifiers."""
+    if _URL_SAFE.fullmatch(segment):
+        return segment
+    return quote(segment, safe="")
+
+
 def _normalize_url(url: str) -> str:
     return url.rstrip("/")
 
 
-@dataclass(slots=True)
+def _make_client(
+    base_url: str, timeout: float, *, limits: Optional[httpx.Limits] = None, http2: bool = False
+) -> httpx.AsyncClient:
+    """Create a pooled AsyncClient; HTTP/2 only when requested and `h2` is available."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        http2=http2 and _HTTP2_AVAILABLE,
+        limits=limits or httpx.Limits(),
+        headers=_DEFAULT_HEADERS,
+    )
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON body from raw bytes, skipping httpx's text decoding step."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return json_codec.loads(content)
+    return response.json()
+
+
+def _limits_from_config(config: QortalConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.http_max_connections,
+        max_keepalive_connections=config.http_max_keepalive_connections,
+        keepalive_expiry=config.http_keepalive_expiry,
+    )
+
+
+# Timestamp for "never happened": elapsed time since it is infinite, so the
+# cooldown and probe-freshness checks need no separate None test.
+_NEVER = -math.inf
+
+
 class _NodeEntry:
-    base_url: str
-    client: Optional[httpx.AsyncClient] = None
-    last_failure: Optional[float] = None
-    last_health_check: Optional[float] = None
+    """Mutable per-node state read on every dispatch."""
+
+    __slots__ = (
+        "base_url",
+        "client",
+        "last_failure",
+        "last_health_check",
+        "last_health_ok",
+        "probe",
+        "gate",
+    )
+
+    def __init__(self, base_url: str, gate: Optional[asyncio.Semaphore] = None) -> None:
+        self.base_url = base_url
+        self.client: Optional[httpx.AsyncClient] = None
+        self.last_failure: float = _NEVER
+        self.last_health_check: float = _NEVER
+        self.last_health_ok = False
+        self.probe: Optional[asyncio.Task[bool]] = None
+        self.gate = gate
+
+
+def _make_gate(limits: Optional[httpx.Limits]) -> Optional[asyncio.Semaphore]:
+    """Return a semaphore matching the connection limit, or None when unbounded."""
+    if limits is None or not limits.max_connections:
+        return None
+    return asyncio.Semaphore(limits.max_connections)
+
+
+async def _gated_get(
+    gate: Optional[asyncio.Semaphore],
+    client: httpx.AsyncClient,
+    path: str,
+    params: Optional[Mapping[str, Any]],
+    headers: Mapping[str, str],
+) -> httpx.Response:
+    """
+    Issue a GET once a slot on the node's gate is free.
+
+    Waiting here rather than inside httpx's pool means a burst of tool calls
+    cannot surface as `PoolTimeout`, which would be mistaken for the node
+    being unreachable.
+    """
+    if gate is None:
+        return await client.get(path, params=params, headers=headers)
+    async with gate:
+        return await client.get(path, params=params, headers=headers)
 
 
 class NodePool:
@@ -82,71 +344,129 @@ class NodePool:
         cooldown_seconds: float = 30.0,
         health_check_path: Optional[str] = None,
         health_check_timeout: Optional[float] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
     ) -> None:
-        self._entries: List[_NodeEntry] = [_NodeEntry(base_url=node) for node in nodes]
+        self._entries: List[_NodeEntry] = [
+            _NodeEntry(node, gate=_make_gate(limits)) for node in nodes
+        ]
+        self._by_url: Dict[str, _NodeEntry] = {entry.base_url: entry for entry in self._entries}
         self._timeout = timeout
         self._cooldown_seconds = cooldown_seconds
-        self._primary_url = nodes[0] if nodes else None
+        self._trusted_urls: frozenset[str] = frozenset(nodes[:1])
         self._health_check_path = health_check_path
         self._health_check_timeout = health_check_timeout or timeout
+        self._limits = limits
+        self._http2 = http2
 
-    def _in_cooldown(self, entry: _NodeEntry) -> bool:
-        if entry.last_failure is None:
-            return False
-        return (time.monotonic() - entry.last_failure) < self._cooldown_seconds
+    def _make_client(self, base_url: str) -> httpx.AsyncClient:
+        return _make_client(base_url, self._timeout, limits=self._limits, http2=self._http2)
+
+    def _in_cooldown(self, entry: _NodeEntry, now: float) -> bool:
+        return (now - entry.last_failure) < self._cooldown_seconds
 
     async def _probe(self, entry: _NodeEntry) -> bool:
         if not self._health_check_path:
             return True
-        if entry.client is None:
-            entry.client = httpx.AsyncClient(base_url=entry.base_url, timeout=self._timeout)
+        client = self._client_for(entry)
         try:
-            response = await entry.client.get(
+            response = await client.get(
                 self._health_check_path, timeout=self._health_check_timeout
             )
-            entry.last_health_check = time.monotonic()
-            if response.status_code < 400:
-                self.report_success(entry.base_url)
-                return True
-            self.report_failure(entry.base_url)
-            return False
+            healthy = response.status_code < 400
         except httpx.RequestError:
-            self.report_failure(entry.base_url)
-            return False
+            healthy = False
+        now = time.monotonic()
+        entry.last_health_check = now
+        entry.last_health_ok = healthy
+        if healthy:
+            self.report_success(entry.base_url)
+        else:
+            self.report_failure(entry.base_url, now=now)
+        return healthy
+
+    async def _shared_probe(self, entry: _NodeEntry) -> bool:
+        """Probe a node, letting concurrent dispatches share one in-flight check."""
+        if entry.probe is None or entry.probe.done():
+            entry.probe = asyncio.ensure_future(self._probe(entry))
+        return await asyncio.shield(entry.probe)
+
+    def _recent_probe(self, entry: _NodeEntry, now: float) -> Optional[bool]:
+        """Return the cached probe outcome if it is fresh enough to reuse."""
+        if now - entry.last_health_check >= self._cooldown_seconds / 4:
+            return None
+        return entry.last_health_ok
+
+    def _client_for(self, entry: _NodeEntry) -> httpx.AsyncClient:
+        if entry.client is None:
+            entry.client = self._make_client(entry.base_url)
+        return entry.client
+
+    def _with_primary_fallback(
+        self, candidates: List[Tuple[httpx.AsyncClient, _NodeEntry]]
+    ) -> List[Tuple[httpx.AsyncClient, _NodeEntry]]:
+        if not candidates and self._entries:
+            primary = self._entries[0]
+            candidates.append((self._client_for(primary), primary))
+        return candidates
+
+    def get_candidates_sync(self) -> Optional[List[Tuple[httpx.AsyncClient, _NodeEntry]]]:
+        """
+        Return candidates without awaiting, or None if a node needs a fresh probe.
+
+        This is the common path: no health check configured, or every node is
+        either healthy, in cooldown, or has a recent probe result.
+        """
+        candidates: List[Tuple[httpx.AsyncClient, _NodeEntry]] = []
+        now = time.monotonic()
+        for entry in self._entries:
+            if self._in_cooldown(entry, now):
+                continue
+            if self._health_check_path and entry.last_failure != _NEVER:
+                healthy = self._recent_probe(entry, now)
+                if healthy is None:
+                    return None
+                if not healthy:
+                    continue
+            candidates.append((self._client_for(entry), entry))
+        return self._with_primary_fallback(candidates)
 
     async def get_candidates(self) -> List[Tuple[httpx.AsyncClient, _NodeEntry]]:
         """Return clients to try in priority order, skipping nodes in cooldown."""
         candidates: List[Tuple[httpx.AsyncClient, _NodeEntry]] = []
+        # One timestamp per dispatch. Probes awaited below can only make it
+        # older, which errs towards keeping later nodes in cooldown.
+        now = time.monotonic()
         for entry in self._entries:
-            if self._in_cooldown(entry):
+            if self._in_cooldown(entry, now):
                 continue
-            if entry.client is None:
-                entry.client = httpx.AsyncClient(base_url=entry.base_url, timeout=self._timeout)
-            if entry.last_failure is not None and self._health_check_path:
-                if not await self._probe(entry):
+            client = self._client_for(entry)
+            if self._health_check_path and entry.last_failure != _NEVER:
+                healthy = self._recent_probe(entry, now)
+                if healthy is None:
+                    healthy = await self._shared_probe(entry)
+                if not healthy:
                     continue
-            candidates.append((entry.client, entry))
-        if not candidates and self._entries:
-            primary = self._entries[0]
-            if primary.client is None:
-                primary.client = httpx.AsyncClient(base_url=primary.base_url, timeout=self._timeout)
-            candidates.append((primary.client, primary))
-        return candidates
+            candidates.append((client, entry))
+        return self._with_primary_fallback(candidates)
 
-    def report_failure(self, base_url: str) -> None:
-        for entry in self._entries:
-            if entry.base_url == base_url:
-                entry.last_failure = time.monotonic()
-                break
+    def report_failure(self, base_url: str, *, now: Optional[float] = None) -> None:
+        entry = self._by_url.get(base_url)
+        if entry is not None:
+            entry.last_failure = time.monotonic() if now is None else now
 
     def report_success(self, base_url: str) -> None:
-        for entry in self._entries:
-            if entry.base_url == base_url:
-                entry.last_failure = None
-                break
+        entry = self._by_url.get(base_url)
+        if entry is not None:
+            entry.last_failure = _NEVER
 
     def is_trusted(self, base_url: str) -> bool:
-        return base_url == self._primary_url
+        return base_url in self._trusted_urls
+
+    def primary(self) -> Tuple[httpx.AsyncClient, _NodeEntry]:
+        """Return the trusted primary node, regardless of cooldown."""
+        entry = self._entries[0]
+        return self._client_for(entry), entry
 
     async def aclose(self) -> None:
         for entry in self._entries:
@@ -155,6 +475,16 @@ class NodePool:
                 entry.client = None
 
 
+class _InFlight:
+    """A shared upstream request and the number of callers that joined it."""
+
+    __slots__ = ("task", "joiners")
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.joiners = 0
+
+
 class QortalApiClient:
     """Async client for the limited Qortal Core API surface."""
 
@@ -168,6 +498,17 @@ class QortalApiClient:
         self._client: Optional[httpx.AsyncClient] = async_client
         self._owns_client = async_client is None
         self._node_pool = self._build_node_pool()
+        self._memory_cache = (
+            TTLCache(self.config.response_cache_size) if self.config.response_cache_size > 0 else None
+        )
+        self._disk_cache = self._build_disk_cache()
+        self._inflight: Dict[Tuple[Any, ...], _InFlight] = {}
+        self._chain_height: Optional[int] = None
+        self._chain_height_checked: Optional[float] = None
+        self._gate = _make_gate(_limits_from_config(self.config))
+        self._auth_headers: Mapping[str, str] = (
+            MappingProxyType({"X-API-KEY": self.config.api_key}) if self.config.api_key else _EMPTY_HEADERS
+        )
 
     def _build_node_pool(self) -> Optional[NodePool]:
         if not self.config.allow_public_fallback:
@@ -187,12 +528,27 @@ class QortalApiClient:
             cooldown_seconds=self.config.fallback_cooldown_seconds,
             health_check_path=self.config.fallback_health_check_path,
             health_check_timeout=self.config.fallback_health_check_timeout,
+            limits=_limits_from_config(self.config),
+            http2=self.config.http2,
+        )
+
+    def _build_disk_cache(self) -> Optional[DiskResponseCache]:
+        if not self.config.disk_cache_dir:
+            return None
+        if diskcache is None:
+            logger.warning("Disk cache directory configured but diskcache is not installed; disk cache disabled")
+            return None
+        return DiskResponseCache(
+            self.config.disk_cache_dir, size_limit=self.config.disk_cache_size_limit
         )
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.config.base_url, timeout=self.config.timeout
+            self._client = _make_client(
+                self.config.base_url,
+                self.config.timeout,
+                limits=_limits_from_config(self.config),
+                http2=self.config.http2,
             )
             self._owns_client = True
         return self._client
@@ -203,6 +559,8 @@ class QortalApiClient:
         if self._client is not None and self._owns_client:
             await self._client.aclose()
             self._client = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     def _map_error(
         self, error_code: str | int | None, status_code: int, message: str | None = None
@@ -213,149 +571,226 @@ class QortalApiClient:
         elif isinstance(error_code, str):
             normalized = error_code.upper()
 
-        message_upper = (message or "").upper()
-        lowered_message = (message or "").lower()
-        signals = set()
-        if normalized:
-            signals.add(normalized)
-        if message_upper:
-            signals.add(message_upper)
-
-        invalid_address_signals = {
-            "INVALID_ADDRESS",
-            "INVALID_QORTAL_ADDRESS",
-            "INVALID_RECIPIENT",
-            "102",
-        }
-        if signals.intersection(invalid_address_signals) or "invalid address" in lowered_message:
-            return InvalidAddressError(
-                "Invalid Qortal address.",
-                code=normalized or message_upper or None,
-                status_code=status_code,
-            )
-        name_unknown_signals = {"NAME_UNKNOWN", "401"}
-        if signals.intersection(name_unknown_signals):
-            return NameNotFoundError(
-                "Name not found.", code=normalized or message_upper or None, status_code=status_code
-            )
-        block_unknown_signals = {"BLOCK_UNKNOWN", "BLOCK NOT FOUND"}
-        if signals.intersection(block_unknown_signals) or "block unknown" in lowered_message:
-            return QortalApiError(
-                "Block not found.", code=normalized or message_upper or None, status_code=status_code
-            )
-        invalid_asset_signals = {"INVALID_ASSET_ID", "601"}
-        if signals.intersection(invalid_asset_signals):
-            return QortalApiError(
-                "Asset not found.", code=normalized or message_upper or None, status_code=status_code
-            )
-        unknown_signals = {"ADDRESS_UNKNOWN", "UNKNOWN_ADDRESS", "124"}
-        if signals.intersection(unknown_signals) or "unknown address" in lowered_message:
-            return AddressNotFoundError(
-                "Address not found on chain.",
-                code=normalized or message_upper or None,
-                status_code=status_code,
-            )
-        group_unknown_signals = {"GROUP_UNKNOWN", "1101"}
-        if signals.intersection(group_unknown_signals):
-            return GroupNotFoundError(
-                "Group not found.", code=normalized or message_upper or None, status_code=status_code
-            )
-        invalid_public_key_signals = {"INVALID_PUBLIC_KEY"}
-        if signals.intersection(invalid_public_key_signals) or "invalid public key" in lowered_message:
-            return QortalApiError(
-                "Invalid public key.", code=normalized or message_upper or None, status_code=status_code
-            )
-        invalid_data_signals = {"INVALID_DATA"}
-        if signals.intersection(invalid_data_signals) or "invalid data" in lowered_message:
-            return QortalApiError(
-                "Qortal API error.", code=normalized or message_upper or None, status_code=status_code
-            )
+        message_upper = ""
+        lowered_message = ""
+        if message:
+            message_upper = message.upper()
+            lowered_message = message.lower()
+        code = normalized or message_upper or None
+
+        for signals, substring, exc_class, user_message in _ERROR_RULES:
+            if (
+                normalized in signals
+                or message_upper in signals
+                or (substring is not None and substring in lowered_message)
+            ):
+                return exc_class(user_message, code=code, status_code=status_code)
+
         if status_code == 404:
-            return QortalApiError(
-                "Resource not found.", code=normalized or message_upper or None, status_code=status_code
-            )
-        if status_code in {401, 403}:
+            return QortalApiError("Resource not found.", code=code, status_code=status_code)
+        if status_code in (401, 403):
             return UnauthorizedError(
-                "Unauthorized or API key required.",
-                code=normalized or message_upper or None,
-                status_code=status_code,
+                "Unauthorized or API key required.", code=code, status_code=status_code
             )
-        return QortalApiError(
-            "Qortal API error.", code=normalized or message_upper or None, status_code=status_code
-        )
+        return QortalApiError("Qortal API error.", code=code, status_code=status_code)
 
     async def _request(
         self,
         path: str,
         *,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         use_api_key: bool = False,
         expect_dict: bool = True,
         expect_json: bool = True,
     ) -> Any:
-        if self._node_pool is None:
-            return await self._request_single(
+        key = cache_key(path, params, use_api_key)
+        ttl = response_ttl(path) if self._memory_cache is not None else 0.0
+        if ttl > 0:
+            cached = self._memory_cache.get(key)
+            if cached is not MISS:
+                return cached
+
+        # Single-flight: concurrent identical requests share one upstream call.
+        # The shared task is shielded so a cancelled caller does not abort it
+        # for everyone else. Once anyone has joined, every caller (the first
+        # one included) gets its own copy so no caller can mutate another's
+        # result; an uncontended call returns the result as-is.
+        flight = self._inflight.get(key)
+        if flight is not None:
+            flight.joiners += 1
+            return copy.deepcopy(await asyncio.shield(flight.task))
+        task = asyncio.ensure_future(
+            self._fetch(
                 path,
                 params=params,
                 use_api_key=use_api_key,
                 expect_dict=expect_dict,
                 expect_json=expect_json,
+                memory_key=key if ttl > 0 else None,
+                ttl=ttl,
             )
-        return await self._request_with_pool(
-            path,
-            params=params,
-            use_api_key=use_api_key,
-            expect_dict=expect_dict,
-            expect_json=expect_json,
         )
+        flight = self._inflight[key] = _InFlight(task)
+        # Registered before this caller awaits, so the entry is gone by the
+        # time it resumes and no one can join after the joiner count is read.
+        task.add_done_callback(functools.partial(self._forget_inflight, key, flight))
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result) if flight.joiners else result
+
+    def _forget_inflight(
+        self, key: Tuple[Any, ...], flight: "_InFlight", task: asyncio.Task[Any]
+    ) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the outcome as retrieved even if every waiter was cancelled.
+            task.exception()
 
-    def _build_headers(self, *, use_api_key: bool, trusted: bool) -> Dict[str, str]:
-        headers: Dict[str, str] = {}
-        if use_api_key and trusted and self.config.api_key:
-            headers["X-API-KEY"] = self.config.api_key
-        return headers
+    async def _fetch(
+        self,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]],
+        use_api_key: bool,
+        expect_dict: bool,
+        expect_json: bool,
+        memory_key: Optional[Tuple[Any, ...]],
+        ttl: float,
+    ) -> Any:
+        """Resolve a request via the disk tier or the node, filling the caches."""
+        disk_key: Optional[str] = None
+        if (
+            self._disk_cache is not None
+            and params is None
+            and expect_json
+            and is_immutable_path(path)
+        ):
+            # Key on the configured node so a testnet/mainnet switch never
+            # serves blocks from the other chain.
+            disk_key = f"{self.config.base_url}{path}"
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                if memory_key is not None:
+                    self._memory_cache.set(memory_key, cached, ttl)
+                return cached
+
+        if self._node_pool is None:
+            result = await self._request_single(
+                path,
+                params=params,
+                use_api_key=use_api_key,
+                expect_dict=expect_dict,
+                expect_json=expect_json,
+            )
+            trusted = True
+        else:
+            result, entry = await self._request_with_pool(
+                path,
+                params=params,
+                use_api_key=use_api_key,
+                expect_dict=expect_dict,
+                expect_json=expect_json,
+            )
+            trusted = self._node_pool.is_trusted(entry.base_url)
+
+        if memory_key is not None:
+            self._memory_cache.set(memory_key, result, ttl)
+        # The disk key names the configured node, and entries never expire, so
+        # only answers from the trusted node are persisted.
+        if disk_key is not None and trusted:
+            await self._maybe_persist(disk_key, path, result)
+        return result
+
+    async def _current_chain_height(self) -> Optional[int]:
+        """Return a recently fetched chain height, refreshing it when stale."""
+        now = time.monotonic()
+        if (
+            self._chain_height_checked is not None
+            and now - self._chain_height_checked < _CHAIN_HEIGHT_REFRESH_SECONDS
+        ):
+            return self._chain_height
+        try:
+            height = await self._trusted_chain_height()
+        except QortalApiError:
+            return self._chain_height
+        if isinstance(height, int) and not isinstance(height, bool):
+            self._chain_height = height
+            self._chain_height_checked = now
+        return self._chain_height
+
+    async def _trusted_chain_height(self) -> Any:
+        """
+        Fetch the chain height from the trusted node only.
+
+        The height decides what is confirmed enough to persist, so it must
+        not come from a public fallback (or a cached fallback answer).
+        """
+        if self._node_pool is None:
+            return await self._request("/blocks/height", expect_dict=False)
+        client, entry = self._node_pool.primary()
+        try:
+            response = await _gated_get(entry.gate, client, "/blocks/height", None, _EMPTY_HEADERS)
+        except httpx.RequestError as exc:
+            logger.warning("Qortal node unreachable for path %s", "/blocks/height")
+            raise NodeUnreachableError("Node unreachable") from exc
+        return self._process_response(response, expect_dict=False, expect_json=True)
+
+    async def _maybe_persist(self, disk_key: str, path: str, data: Any) -> None:
+        """Persist an immutable response once it is buried deeply enough."""
+        assert self._disk_cache is not None
+        height = payload_height(path, data)
+        if height is None:
+            return
+        chain_height = await self._current_chain_height()
+        if chain_height is None:
+            return
+        if chain_height - height < self.config.disk_cache_min_confirmations:
+            return
+        self._disk_cache.set(disk_key, data)
+
+    def _build_headers(self, *, use_api_key: bool, trusted: bool) -> Mapping[str, str]:
+        if use_api_key and trusted:
+            return self._auth_headers
+        return _EMPTY_HEADERS
 
     def _process_response(
         self, response: httpx.Response, *, expect_dict: bool, expect_json: bool
     ) -> Any:
-        if response.status_code == 401:
-            raise UnauthorizedError("Unauthorized or API key required.", status_code=401)
-
-        data: Any = None
-        if expect_json or response.status_code >= 400:
+        status_code = response.status_code
+        if status_code < 400:
+            if not expect_json:
+                return response.text
             try:
-                data = response.json()
+                data = _decode_json(response)
             except ValueError:
                 data = None
+            if data is None or (expect_dict and not isinstance(data, dict)):
+                raise QortalApiError("Unexpected response from node.", status_code=status_code)
+            return data
 
-        if response.status_code >= 400:
-            error_field: Optional[str | int] = None
-            message_field: Optional[str] = None
-            if isinstance(data, dict):
-                raw_error = data.get("error")
-                if isinstance(raw_error, (str, int)):
-                    error_field = raw_error
-                raw_message = data.get("message")
-                if isinstance(raw_message, str):
-                    message_field = raw_message
-            raise self._map_error(error_field, response.status_code, message=message_field)
-
-        if not expect_json:
-            return response.text
-
-        if data is None:
-            raise QortalApiError("Unexpected response from node.", status_code=response.status_code)
-
-        if expect_dict and not isinstance(data, dict):
-            raise QortalApiError("Unexpected response from node.", status_code=response.status_code)
+        if status_code == 401:
+            raise UnauthorizedError("Unauthorized or API key required.", status_code=401)
 
-        return data
+        error_field: Optional[str | int] = None
+        message_field: Optional[str] = None
+        try:
+            body = _decode_json(response)
+        except ValueError:
+            body = None
+        if isinstance(body, dict):
+            raw_error = body.get("error")
+            if isinstance(raw_error, (str, int)):
+                error_field = raw_error
+            raw_message = body.get("message")
+            if isinstance(raw_message, str):
+                message_field = raw_message
+        raise self._map_error(error_field, status_code, message=message_field)
 
     async def _request_single(
         self,
         path: str,
         *,
-        params: Optional[Dict[str, Any]],
+        params: Optional[Mapping[str, Any]],
         use_api_key: bool,
         expect_dict: bool,
         expect_json: bool,
@@ -363,7 +798,7 @@ class QortalApiClient:
         client = await self._get_client()
         headers = self._build_headers(use_api_key=use_api_key, trusted=True)
         try:
-            response = await client.get(path, params=params, headers=headers)
+            response = await _gated_get(self._gate, client, path, params, headers)
         except httpx.RequestError as exc:
             logger.warning("Qortal node unreachable for path %s", path)
             raise NodeUnreachableError("Node unreachable") from exc
@@ -373,35 +808,144 @@ class QortalApiClient:
         self,
         path: str,
         *,
-        params: Optional[Dict[str, Any]],
+        params: Optional[Mapping[str, Any]],
         use_api_key: bool,
         expect_dict: bool,
         expect_json: bool,
-    ) -> Any:
+    ) -> Tuple[Any, _NodeEntry]:
+        """Dispatch across the node pool; returns the result and the node that answered."""
         last_exc: Optional[Exception] = None
         assert self._node_pool is not None
-        candidates = await self._node_pool.get_candidates()
-        for client, entry in candidates:
-            headers = self._build_headers(
-                use_api_key=use_api_key, trusted=self._node_pool.is_trusted(entry.base_url)
-            )
+        pool = self._node_pool
+        ready = pool.get_candidates_sync()
+        if ready is None:
+            ready = await pool.get_candidates()
+        candidates = iter(ready)
+        # Admin calls carry the API key and only succeed on the trusted node, so
+        # they keep strict sequential failover instead of racing public nodes.
+        hedge_after = None if use_api_key else self.config.fallback_hedge_after_seconds
+        if hedge_after is not None and hedge_after <= 0:
+            hedge_after = None
+        pending: Dict[asyncio.Task[httpx.Response], _NodeEntry] = {}
+        error_response: Optional[httpx.Response] = None
+
+        def launch_next() -> bool:
+            for client, entry in candidates:
+                headers = self._build_headers(
+                    use_api_key=use_api_key, trusted=pool.is_trusted(entry.base_url)
+                )
+                task = asyncio.ensure_future(_gated_get(entry.gate, client, path, params, headers))
+                pending[task] = entry
+                return True
+            return False
+
+        launch_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_after, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The in-flight node is slow: hedge onto the next candidate
+                    # while keeping the original request alive.
+                    if not launch_next():
+                        hedge_after = None
+                    continue
+                for task in done:
+                    entry = pending.pop(task)
+                    exc = task.exception()
+                    if isinstance(exc, httpx.RequestError):
+                        logger.warning("Qortal node unreachable for path %s via %s", path, entry.base_url)
+                        pool.report_failure(entry.base_url)
+                        last_exc = exc
+                        continue
+                    if exc is not None:
+                        raise exc
+                    pool.report_success(entry.base_url)
+                    response = task.result()
+                    if (
+                        response.status_code >= 400
+                        and pending
+                        and not pool.is_trusted(entry.base_url)
+                    ):
+                        # A fallback's error only loses the race while other
+                        # hedged requests may still succeed; it is kept in case
+                        # none of them does.
+                        error_response = response
+                        continue
+                    return (
+                        self._process_response(
+                            response, expect_dict=expect_dict, expect_json=expect_json
+                        ),
+                        entry,
+                    )
+                if not pending:
+                    launch_next()
+        finally:
+            if pending:
+                # Cancel losing hedged requests and wait for them to unwind so
+                # their connections go back to the pool; their outcomes
+                # (including CancelledError) are collected, not raised.
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if error_response is not None:
+            # Error responses always raise, so no answering node is reported.
+            self._process_response(error_response, expect_dict=expect_dict, expect_json=expect_json)
+        raise NodeUnreachableError("Node unreachable") from last_exc
+
+    async def _stream_text(
+        self, path: str, *, params: Optional[Mapping[str, Any]]
+    ) -> AsyncIterator[str]:
+        """
+        Yield a text response in decoded chunks without buffering the whole body.
+
+        Chunks are yielded exactly as received, so joining them reproduces the
+        body including line endings.
+
+        Pool failover applies only until a node answers; a connection lost
+        after streaming has started raises `NodeUnreachableError`. Callers
+        that stop early should close the iterator (`contextlib.aclosing`) so
+        the connection and concurrency slot are released promptly.
+        """
+        pool = self._node_pool
+        if pool is None:
+            targets: List[Tuple[httpx.AsyncClient, Optional[_NodeEntry]]] = [
+                (await self._get_client(), None)
+            ]
+        else:
+            ready = pool.get_candidates_sync()
+            if ready is None:
+                ready = await pool.get_candidates()
+            targets = list(ready)
+        last_exc: Optional[Exception] = None
+        for client, entry in targets:
+            started = False
             try:
-                response = await client.get(path, params=params, headers=headers)
+                async with contextlib.AsyncExitStack() as stack:
+                    gate = self._gate if entry is None else entry.gate
+                    if gate is not None:
+                        await stack.enter_async_context(gate)
+                    response = await stack.enter_async_context(
+                        client.stream("GET", path, params=params, headers=_EMPTY_HEADERS)
+                    )
+                    started = True
+                    if entry is not None:
+                        pool.report_success(entry.base_url)
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._process_response(response, expect_dict=False, expect_json=False)
+                    async for chunk in response.aiter_text():
+                        yield chunk
+                    return
             except httpx.RequestError as exc:
-                logger.warning("Qortal node unreachable for path %s via %s", path, entry.base_url)
-                self._node_pool.report_failure(entry.base_url)
+                logger.warning("Qortal node unreachable for path %s", path)
+                if started:
+                    raise NodeUnreachableError("Node unreachable") from exc
+                if entry is not None:
+                    pool.report_failure(entry.base_url)
                 last_exc = exc
-                continue
-            try:
-                result = self._process_response(
-                    response, expect_dict=expect_dict, expect_json=expect_json
-                )
-            except QortalApiError:
-                self._node_pool.report_success(entry.base_url)
-                raise
-            self._node_pool.report_success(entry.base_url)
-            return result
-
         raise NodeUnreachableError("Node unreachable") from last_exc
 
     async def fetch_node_status(self) -> Dict[str, Any]:
@@ -422,74 +966,47 @@ class QortalApiClient:
 
     async def fetch_address_info(self, address: str) -> Dict[str, Any]:
         """Retrieve base account information for an address."""
-        encoded = quote(address, safe="")
+        encoded = _quote_path(address)
         return await self._request(f"/addresses/{encoded}")
 
     async def fetch_address_balance(self, address: str, asset_id: int = 0) -> Dict[str, Any]:
         """Retrieve balance for an address. Defaults to asset 0 (QORT)."""
-        encoded = quote(address, safe="")
-        return await self._request(
-            f"/addresses/balance/{encoded}", params={"assetId": asset_id}, expect_dict=False
-        )
+        encoded = _quote_path(address)
+        params = _DEFAULT_BALANCE_PARAMS if asset_id == 0 else {"assetId": asset_id}
+        return await self._request(f"/addresses/balance/{encoded}", params=params, expect_dict=False)
 
     async def fetch_names_by_owner(self, address: str, *, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None) -> Any:
         """Retrieve names owned by the given address."""
-        encoded = quote(address, safe="")
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request(f"/names/address/{encoded}", params=params or None, expect_dict=False)
+        encoded = _quote_path(address)
+        params = _paging_params(limit, offset, reverse)
+        return await self._request(f"/names/address/{encoded}", params=params, expect_dict=False)
 
     async def fetch_name_info(self, name: str) -> Dict[str, Any]:
         """Retrieve details for a specific name."""
-        encoded = quote(name, safe="")
+        encoded = _quote_path(name)
         return await self._request(f"/names/{encoded}")
 
     async def fetch_primary_name(self, address: str) -> Dict[str, Any]:
         """Retrieve primary name for an address."""
-        encoded = quote(address, safe="")
+        encoded = _quote_path(address)
         return await self._request(f"/names/primary/{encoded}")
 
     async def search_names(self, query: str, *, prefix: Optional[bool] = None, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None) -> Any:
         """Search registered names."""
-        params: Dict[str, Any] = {"query": query}
-        if prefix is not None:
-            params["prefix"] = prefix
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
+        params = _build_params(
+            _SEARCH_NAMES_PARAMS, (prefix, limit, offset, reverse), base={"query": query}
+        )
         return await self._request("/names/search", params=params, expect_dict=False)
 
     async def fetch_all_names(self, *, after: Optional[int] = None, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None) -> Any:
         """List all names."""
-        params: Dict[str, Any] = {}
-        if after is not None:
-            params["after"] = after
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/names", params=params or None, expect_dict=False)
+        params = _build_params(_NAMES_LIST_PARAMS, (after, limit, offset, reverse))
+        return await self._request("/names", params=params, expect_dict=False)
 
     async def fetch_names_for_sale(self, *, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None) -> Any:
         """List names currently for sale."""
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/names/forsale", params=params or None, expect_dict=False)
+        params = _paging_params(limit, offset, reverse)
+        return await self._request("/names/forsale", params=params, expect_dict=False)
 
     async def fetch_trade_offers(
         self,
@@ -500,13 +1017,9 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """List open cross-chain trade offers."""
-        params: Dict[str, Any] = {"limit": limit}
-        if foreign_blockchain:
-            params["foreignBlockchain"] = foreign_blockchain
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
+        params = _build_params(
+            _TRADE_OFFERS_PARAMS, (foreign_blockchain, offset, reverse), base={"limit": limit}
+        )
         return await self._request("/crosschain/tradeoffers", params=params, expect_dict=False)
 
     async def fetch_hidden_trade_offers(
@@ -515,14 +1028,12 @@ class QortalApiClient:
         foreign_blockchain: Optional[str] = None,
     ) -> Any:
         """List hidden cross-chain trade offers."""
-        params: Dict[str, Any] = {}
-        if foreign_blockchain:
-            params["foreignBlockchain"] = foreign_blockchain
-        return await self._request("/crosschain/tradeoffers/hidden", params=params or None, expect_dict=False)
+        params = _build_params(_HIDDEN_OFFERS_PARAMS, (foreign_blockchain,))
+        return await self._request("/crosschain/tradeoffers/hidden", params=params, expect_dict=False)
 
     async def fetch_trade_detail(self, at_address: str) -> Any:
         """Fetch detailed trade info for a specific AT address."""
-        encoded = quote(at_address, safe="")
+        encoded = _quote_path(at_address)
         return await self._request(f"/crosschain/trade/{encoded}")
 
     async def fetch_completed_trades(
@@ -537,35 +1048,30 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch completed cross-chain trades."""
-        params: Dict[str, Any] = {}
-        if foreign_blockchain:
-            params["foreignBlockchain"] = foreign_blockchain
-        if minimum_timestamp is not None:
-            params["minimumTimestamp"] = minimum_timestamp
-        if buyer_public_key:
-            params["buyerPublicKey"] = buyer_public_key
-        if seller_public_key:
-            params["sellerPublicKey"] = seller_public_key
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/crosschain/trades", params=params or None, expect_dict=False)
-
-    async def fetch_trade_ledger(
+        params = _build_params(
+            _COMPLETED_TRADES_PARAMS,
+            (
+                foreign_blockchain,
+                minimum_timestamp,
+                buyer_public_key,
+                seller_public_key,
+                limit,
+                offset,
+                reverse,
+            ),
+        )
+        return await self._request("/crosschain/trades", params=params, expect_dict=False)
+
+    def stream_trade_ledger(
         self,
         *,
         public_key: str,
         minimum_timestamp: Optional[int] = None,
-    ) -> Any:
-        """Fetch trade ledger CSV for a public key."""
-        encoded = quote(public_key, safe="")
-        params: Dict[str, Any] = {}
-        if minimum_timestamp is not None:
-            params["minimumTimestamp"] = minimum_timestamp
-        return await self._request(f"/crosschain/ledger/{encoded}", params=params or None, expect_dict=False, expect_json=False)
+    ) -> AsyncIterator[str]:
+        """Stream trade ledger CSV text for a public key as it arrives."""
+        encoded = _quote_path(public_key)
+        params = _build_params(_TRADE_LEDGER_PARAMS, (minimum_timestamp,))
+        return self._stream_text(f"/crosschain/ledger/{encoded}", params=params)
 
     async def fetch_trade_price(
         self,
@@ -575,13 +1081,9 @@ class QortalApiClient:
         inverse: Optional[bool] = None,
     ) -> Any:
         """Fetch estimated trading price."""
-        encoded = quote(blockchain, safe="")
-        params: Dict[str, Any] = {}
-        if max_trades is not None:
-            params["maxtrades"] = max_trades
-        if inverse is not None:
-            params["inverse"] = inverse
-        return await self._request(f"/crosschain/price/{encoded}", params=params or None, expect_dict=False)
+        encoded = _quote_path(blockchain)
+        params = _build_params(_TRADE_PRICE_PARAMS, (max_trades, inverse))
+        return await self._request(f"/crosschain/price/{encoded}", params=params, expect_dict=False)
 
     async def fetch_block_at_timestamp(self, timestamp: int) -> Any:
         """Fetch block at/just before a timestamp."""
@@ -597,9 +1099,7 @@ class QortalApiClient:
 
     async def fetch_block_summaries(self, *, start: int, end: int, count: Optional[int] = None) -> Any:
         """Fetch block summaries in a range."""
-        params: Dict[str, Any] = {"start": start, "end": end}
-        if count is not None:
-            params["count"] = count
+        params = _build_params(_BLOCK_SUMMARIES_PARAMS, (count,), base={"start": start, "end": end})
         return await self._request("/blocks/summaries", params=params, expect_dict=False)
 
     async def fetch_block_range(
@@ -611,11 +1111,9 @@ class QortalApiClient:
         include_online_signatures: Optional[bool] = None,
     ) -> Any:
         """Fetch blocks in a range."""
-        params: Dict[str, Any] = {"count": count}
-        if reverse is not None:
-            params["reverse"] = reverse
-        if include_online_signatures is not None:
-            params["includeOnlineSignatures"] = include_online_signatures
+        params = _build_params(
+            _BLOCK_RANGE_PARAMS, (reverse, include_online_signatures), base={"count": count}
+        )
         return await self._request(f"/blocks/range/{height}", params=params, expect_dict=False)
 
     async def search_transactions(
@@ -631,38 +1129,25 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Search transactions (read-only)."""
-        params: Dict[str, Any] = {}
-        if start_block is not None:
-            params["startBlock"] = start_block
-        if block_limit is not None:
-            params["blockLimit"] = block_limit
-        if tx_types:
-            params["txType"] = tx_types
-        if address:
-            params["address"] = address
-        if confirmation_status:
-            params["confirmationStatus"] = confirmation_status
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
+        params = _build_params(
+            _SEARCH_TX_PARAMS,
+            (start_block, block_limit, tx_types, address, confirmation_status, limit, offset, reverse),
+        )
         return await self._request("/transactions/search", params=params, expect_dict=False)
 
     async def fetch_block_by_signature(self, signature: str) -> Any:
         """Fetch block by signature."""
-        encoded = quote(signature, safe="")
+        encoded = _quote_path(signature)
         return await self._request(f"/blocks/signature/{encoded}")
 
     async def fetch_block_height_by_signature(self, signature: str) -> Any:
         """Fetch block height from signature."""
-        encoded = quote(signature, safe="")
-        height_text = await self._request(f"/blocks/height/{encoded}", expect_dict=False, expect_json=False)
-        try:
-            return int(height_text.strip())
-        except (AttributeError, TypeError, ValueError):
+        encoded = _quote_path(signature)
+        # The node answers with a bare integer, which is valid JSON.
+        height = await self._request(f"/blocks/height/{encoded}", expect_dict=False)
+        if not isinstance(height, int) or isinstance(height, bool):
             raise QortalApiError("Unexpected response from node.")
+        return height
 
     async def fetch_first_block(self) -> Any:
         """Fetch first block."""
@@ -680,23 +1165,17 @@ class QortalApiClient:
         self, *, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None
     ) -> Any:
         """Fetch list of block signers."""
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/blocks/signers", params=params or None, expect_dict=False)
+        params = _paging_params(limit, offset, reverse)
+        return await self._request("/blocks/signers", params=params, expect_dict=False)
 
     async def fetch_transaction_by_signature(self, signature: str) -> Any:
         """Fetch transaction by signature."""
-        encoded = quote(signature, safe="")
+        encoded = _quote_path(signature)
         return await self._request(f"/transactions/signature/{encoded}")
 
     async def fetch_transaction_by_reference(self, reference: str) -> Any:
         """Fetch transaction by reference."""
-        encoded = quote(reference, safe="")
+        encoded = _quote_path(reference)
         return await self._request(f"/transactions/reference/{encoded}")
 
     async def fetch_transactions_by_block(
@@ -708,15 +1187,9 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch transactions for a block signature."""
-        encoded = quote(signature, safe="")
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request(f"/transactions/block/{encoded}", params=params or None, expect_dict=False)
+        encoded = _quote_path(signature)
+        params = _paging_params(limit, offset, reverse)
+        return await self._request(f"/transactions/block/{encoded}", params=params, expect_dict=False)
 
     async def fetch_transactions_by_address(
         self,
@@ -728,17 +1201,9 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch transactions involving an address."""
-        encoded = quote(address, safe="")
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if confirmation_status:
-            params["confirmationStatus"] = confirmation_status
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request(f"/transactions/address/{encoded}", params=params or None, expect_dict=False)
+        encoded = _quote_path(address)
+        params = _build_params(_TX_LIST_PARAMS, (limit, offset, confirmation_status, reverse))
+        return await self._request(f"/transactions/address/{encoded}", params=params, expect_dict=False)
 
     async def fetch_transactions_by_creator(
         self,
@@ -750,17 +1215,9 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch transactions by creator public key."""
-        encoded = quote(public_key, safe="")
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if confirmation_status:
-            params["confirmationStatus"] = confirmation_status
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request(f"/transactions/creator/{encoded}", params=params or None, expect_dict=False)
+        encoded = _quote_path(public_key)
+        params = _build_params(_TX_LIST_PARAMS, (limit, offset, confirmation_status, reverse))
+        return await self._request(f"/transactions/creator/{encoded}", params=params, expect_dict=False)
 
     async def fetch_assets(
         self,
@@ -771,25 +1228,13 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """List assets."""
-        params: Dict[str, Any] = {}
-        if include_data is not None:
-            params["includeData"] = include_data
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/assets", params=params or None, expect_dict=False)
+        params = _build_params(_ASSETS_PARAMS, (include_data, limit, offset, reverse))
+        return await self._request("/assets", params=params, expect_dict=False)
 
     async def fetch_asset_info(self, *, asset_id: Optional[int] = None, asset_name: Optional[str] = None) -> Any:
         """Fetch asset info by id or name."""
-        params: Dict[str, Any] = {}
-        if asset_id is not None:
-            params["assetId"] = asset_id
-        if asset_name:
-            params["assetName"] = asset_name
-        return await self._request("/assets/info", params=params or None)
+        params = _build_params(_ASSET_INFO_PARAMS, (asset_id, asset_name))
+        return await self._request("/assets/info", params=params)
 
     async def fetch_asset_balances(
         self,
@@ -803,22 +1248,11 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch asset balances for addresses and/or asset IDs."""
-        params: Dict[str, Any] = {}
-        if addresses:
-            params["address"] = addresses
-        if asset_ids:
-            params["assetId"] = asset_ids
-        if ordering:
-            params["ordering"] = ordering
-        if exclude_zero is not None:
-            params["excludeZero"] = exclude_zero
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/assets/balances", params=params or None, expect_dict=False)
+        params = _build_params(
+            _ASSET_BALANCES_PARAMS,
+            (addresses, asset_ids, ordering, exclude_zero, limit, offset, reverse),
+        )
+        return await self._request("/assets/balances", params=params, expect_dict=False)
 
     async def search_qdn(
         self,
@@ -835,25 +1269,11 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Search arbitrary/QDN metadata."""
-        params: Dict[str, Any] = {"limit": limit}
-        if address:
-            params["address"] = address
-        if service is not None:
-            params["service"] = service
-        if confirmation_status:
-            params["confirmationStatus"] = confirmation_status
-        if start_block is not None:
-            params["startBlock"] = start_block
-        if block_limit is not None:
-            params["blockLimit"] = block_limit
-        if tx_group_id is not None:
-            params["txGroupId"] = tx_group_id
-        if name:
-            params["name"] = name
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
+        params = _build_params(
+            _SEARCH_QDN_PARAMS,
+            (address, service, confirmation_status, start_block, block_limit, tx_group_id, name, offset, reverse),
+            base={"limit": limit},
+        )
         return await self._request("/arbitrary/search", params=params, expect_dict=False)
 
     async def fetch_chat_messages(
@@ -873,32 +1293,24 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Search chat messages."""
-        params: Dict[str, Any] = {}
-        if before is not None:
-            params["before"] = before
-        if after is not None:
-            params["after"] = after
-        if tx_group_id is not None:
-            params["txGroupId"] = tx_group_id
-        if involving:
-            params["involving"] = involving
-        if reference:
-            params["reference"] = reference
-        if chat_reference:
-            params["chatreference"] = chat_reference
-        if has_chat_reference is not None:
-            params["haschatreference"] = has_chat_reference
-        if sender:
-            params["sender"] = sender
-        if encoding:
-            params["encoding"] = encoding
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/chat/messages", params=params or None, expect_dict=False)
+        params = _build_params(
+            _CHAT_SEARCH_PARAMS,
+            (
+                before,
+                after,
+                tx_group_id,
+                involving,
+                reference,
+                chat_reference,
+                has_chat_reference,
+                sender,
+                encoding,
+                limit,
+                offset,
+                reverse,
+            ),
+        )
+        return await self._request("/chat/messages", params=params, expect_dict=False)
 
     async def count_chat_messages(
         self,
@@ -917,80 +1329,61 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> int:
         """Count chat messages matching criteria."""
-        params: Dict[str, Any] = {}
-        if before is not None:
-            params["before"] = before
-        if after is not None:
-            params["after"] = after
-        if tx_group_id is not None:
-            params["txGroupId"] = tx_group_id
-        if involving:
-            params["involving"] = involving
-        if reference:
-            params["reference"] = reference
-        if chat_reference:
-            params["chatreference"] = chat_reference
-        if has_chat_reference is not None:
-            params["haschatreference"] = has_chat_reference
-        if sender:
-            params["sender"] = sender
-        if encoding:
-            params["encoding"] = encoding
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
+        params = _build_params(
+            _CHAT_SEARCH_PARAMS,
+            (
+                before,
+                after,
+                tx_group_id,
+                involving,
+                reference,
+                chat_reference,
+                has_chat_reference,
+                sender,
+                encoding,
+                limit,
+                offset,
+                reverse,
+            ),
+        )
         text_response = await self._request(
-            "/chat/messages/count", params=params or None, expect_json=False, expect_dict=False
+            "/chat/messages/count", params=params, expect_json=False, expect_dict=False
         )
+        # int() accepts the text body directly and ignores surrounding whitespace.
         try:
-            return int(str(text_response).strip())
+            return int(text_response)
         except (TypeError, ValueError):
             raise QortalApiError("Unexpected response from node.")
 
     async def fetch_chat_message(self, signature: str, *, encoding: Optional[str] = None) -> Any:
         """Fetch a single chat message by signature."""
-        encoded = quote(signature, safe="")
-        params: Dict[str, Any] = {}
-        if encoding:
-            params["encoding"] = encoding
-        return await self._request(f"/chat/message/{encoded}", params=params or None)
+        encoded = _quote_path(signature)
+        params = _build_params(_CHAT_MESSAGE_PARAMS, (encoding,))
+        return await self._request(f"/chat/message/{encoded}", params=params)
 
     async def fetch_active_chats(
         self, address: str, *, encoding: Optional[str] = None, has_chat_reference: Optional[bool] = None
     ) -> Any:
         """Fetch active chats for an address."""
-        encoded = quote(address, safe="")
-        params: Dict[str, Any] = {}
-        if encoding:
-            params["encoding"] = encoding
-        if has_chat_reference is not None:
-            params["haschatreference"] = has_chat_reference
-        return await self._request(f"/chat/active/{encoded}", params=params or None)
+        encoded = _quote_path(address)
+        params = _build_params(_ACTIVE_CHATS_PARAMS, (encoding, has_chat_reference))
+        return await self._request(f"/chat/active/{encoded}", params=params)
 
     async def fetch_groups(
         self, *, limit: Optional[int] = None, offset: Optional[int] = None, reverse: Optional[bool] = None
     ) -> Any:
         """List groups with optional paging."""
-        params: Dict[str, Any] = {}
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request("/groups", params=params or None, expect_dict=False)
+        params = _paging_params(limit, offset, reverse)
+        return await self._request("/groups", params=params, expect_dict=False)
 
     async def fetch_groups_by_owner(self, address: str) -> Any:
         """List groups owned by address."""
-        encoded = quote(address, safe="")
+        encoded = _quote_path(address)
         return await self._request(f"/groups/owner/{encoded}", expect_dict=False)
 
     async def fetch_groups_by_member(self, address: str) -> Any:
         """List groups where address is a member."""
-        encoded = quote(address, safe="")
+        encoded = _quote_path(address)
         return await self._request(f"/groups/member/{encoded}", expect_dict=False)
 
     async def fetch_group(self, group_id: int) -> Any:
@@ -1007,20 +1400,12 @@ class QortalApiClient:
         reverse: Optional[bool] = None,
     ) -> Any:
         """Fetch group members (optionally admins only)."""
-        params: Dict[str, Any] = {}
-        if only_admins is not None:
-            params["onlyAdmins"] = only_admins
-        if limit is not None:
-            params["limit"] = limit
-        if offset is not None:
-            params["offset"] = offset
-        if reverse is not None:
-            params["reverse"] = reverse
-        return await self._request(f"/groups/members/{group_id}", params=params or None)
+        params = _build_params(_GROUP_MEMBERS_PARAMS, (only_admins, limit, offset, reverse))
+        return await self._request(f"/groups/members/{group_id}", params=params)
 
     async def fetch_group_invites_by_address(self, address: str) -> Any:
         """List pending invites for an address."""
-        encoded = quote(address, safe="")
+        encoded = _quote_path(address)
         return await self._request(f"/groups/invites/{encoded}", expect_dict=False)
 
     async def fetch_group_invites_by_group(self, group_id: int) -> Any:
@@ -2,55 +2,109 @@
 
 from __future__ import annotations
 
-import asyncio
 import time
-from typing import Dict
+from collections import OrderedDict
 
 
 class TokenBucket:
+    """
+    Token bucket implemented as GCRA (generic cell rate algorithm).
+
+    Instead of a token count refilled on every call, the bucket keeps the
+    theoretical arrival time (`_tat_ns`) of the next conforming request. A
+    request fits if, after charging it, `_tat_ns` is at most `capacity / rate`
+    seconds ahead of now, which admits the same bursts and sustained rate as
+    the classic form. Times are integer nanoseconds from `time.monotonic_ns`,
+    so the check does no float arithmetic and never drifts over long uptimes.
+    The check never awaits, so it needs no lock; `try_consume` is the
+    synchronous form and `consume` the awaitable one.
+
+    A rate of zero (or less) never refills: the initial `capacity` is admitted
+    and everything after it is denied.
+    """
+
+    __slots__ = ("rate", "capacity", "_ns_per_token", "_burst_ns", "_tat_ns", "_remaining")
+
     def __init__(self, rate: float, capacity: float) -> None:
         self.rate = rate
         self.capacity = capacity
-        self.tokens = capacity
-        self.timestamp = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._tat_ns = time.monotonic_ns()
+        if rate > 0:
+            self._ns_per_token = round(1e9 / rate)
+            self._burst_ns = round(capacity * 1e9 / rate)
+            self._remaining: float | None = None
+        else:
+            self._ns_per_token = self._burst_ns = 0
+            self._remaining = capacity
 
     async def consume(self, amount: float = 1.0) -> bool:
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.timestamp
-            self.timestamp = now
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            if self.tokens >= amount:
-                self.tokens -= amount
-                return True
+        return self.try_consume(amount)
+
+    def try_consume(self, amount: float = 1.0) -> bool:
+        if self._remaining is not None:
+            if self._remaining < amount:
+                return False
+            self._remaining -= amount
+            return True
+        now = time.monotonic_ns()
+        cost = self._ns_per_token if amount == 1 else round(amount * self._ns_per_token)
+        tat = max(self._tat_ns, now) + cost
+        if tat - now > self._burst_ns:
             return False
+        self._tat_ns = tat
+        return True
 
 
 class RateLimiter:
+    __slots__ = ("bucket",)
+
     def __init__(self, rate_per_sec: float, burst: float | None = None) -> None:
         burst = burst if burst is not None else rate_per_sec
         self.bucket = TokenBucket(rate_per_sec, burst)
 
     async def allow(self) -> bool:
-        return await self.bucket.consume()
+        return self.bucket.try_consume()
+
+    def try_allow(self) -> bool:
+        return self.bucket.try_consume()
 
 
 class PerKeyRateLimiter:
-    """Per-key token buckets with a shared configuration."""
+    """
+    Per-key token buckets with a shared configuration.
 
-    def __init__(self, rate_per_sec: float, burst: float | None = None, per_tool: dict[str, float] | None = None) -> None:
+    At most `max_keys` buckets are kept; the least recently used one is
+    dropped when a new key arrives, so memory stays bounded however many
+    distinct keys are seen. A dropped key starts again with a full bucket.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: float | None = None,
+        per_tool: dict[str, float] | None = None,
+        max_keys: int = 10_000,
+    ) -> None:
         self.rate = rate_per_sec
         self.burst = burst if burst is not None else rate_per_sec
         self.per_tool = per_tool or {}
-        self._limiters: Dict[str, RateLimiter] = {}
-        self._lock = asyncio.Lock()
+        self.max_keys = max_keys
+        self._limiters: OrderedDict[str, RateLimiter] = OrderedDict()
 
     async def allow(self, key: str) -> bool:
-        async with self._lock:
-            limiter = self._limiters.get(key)
-            if limiter is None:
-                rate = self.per_tool.get(key, self.rate)
-                limiter = RateLimiter(rate, self.burst)
-                self._limiters[key] = limiter
-        return await limiter.allow()
+        return self.try_allow(key)
+
+    def try_allow(self, key: str) -> bool:
+        """Synchronous form of `allow`; the awaitable form only wraps it."""
+        # Plain synchronous code: coroutines on the event loop cannot
+        # interleave with the lookup and insert, so no lock is needed.
+        limiters = self._limiters
+        limiter = limiters.get(key)
+        if limiter is None:
+            if len(limiters) >= self.max_keys:
+                limiters.popitem(last=False)
+            rate = self.per_tool.get(key, self.rate)
+            limiter = limiters[key] = RateLimiter(rate, self.burst)
+        else:
+            limiters.move_to_end(key)
+        return limiter.bucket.try_consume()
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+import os
 import time
-import uuid
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-from fastapi import FastAPI, Query, Request
+from fastapi import Depends, FastAPI, Query, Request
 from fastapi.responses import JSONResponse, Response
 
-from qortal_mcp import mcp
+from qortal_mcp import __version__, json_codec, mcp
 from qortal_mcp.config import default_config
 from qortal_mcp.metrics import default_metrics
 from qortal_mcp.qortal_api import default_client
@@ -50,22 +51,32 @@ from qortal_mcp.tools import (
 )
 
 logger = logging.getLogger(__name__)
+
+# Optional `extra=` fields copied from log records into JSON log lines.
+_JSON_LOG_EXTRAS = ("tool", "request_id", "error")
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "name": record.name,
+        }
+        fields = record.__dict__
+        for key in _JSON_LOG_EXTRAS:
+            if key in fields:
+                payload[key] = fields[key]
+        line = json_codec.dumps(payload).decode()
+        if not line.isascii():
+            # Keep log lines ASCII-only so non-UTF-8 streams never fail, in the
+            # same compact layout as the orjson path.
+            line = json.dumps(payload, separators=(",", ":"))
+        return line
+
+
 if default_config.log_format.lower() == "json":
     try:
-        import json
-
-        class JsonFormatter(logging.Formatter):
-            def format(self, record: logging.LogRecord) -> str:
-                payload = {
-                    "level": record.levelname,
-                    "message": record.getMessage(),
-                    "name": record.name,
-                }
-                for key in ("tool", "request_id", "error"):
-                    if hasattr(record, key):
-                        payload[key] = getattr(record, key)
-                return json.dumps(payload)
-
         handler = logging.StreamHandler()
         handler.setFormatter(JsonFormatter())
         logging.basicConfig(level=getattr(logging, default_config.log_level.upper(), logging.INFO), handlers=[handler])
@@ -78,9 +89,30 @@ rate_limiter = PerKeyRateLimiter(
     per_tool=default_config.per_tool_rate_limits,
 )
 HEALTH_STATUS = {"status": "ok"}
-APP_VERSION = "0.1.0"
+# Constant JSON-RPC style envelope returned with every 429.
+_RATE_LIMITED_BODY = json.dumps(
+    {"jsonrpc": "2.0", "error": {"code": 429, "message": "Rate limit exceeded"}}, separators=(",", ":")
+).encode()
+# The health body never changes, so it is encoded once instead of per probe.
+_HEALTH_BODY = json.dumps(HEALTH_STATUS, separators=(",", ":")).encode()
+APP_VERSION = __version__
 MCP_SERVER_NAME = "qortal-mcp-server"
 MCP_SERVER_VERSION = APP_VERSION
+# The tool registry is fixed at import (initialize advertises listChanged:
+# false), so the tools/list result is encoded once and spliced into replies.
+_TOOLS_LIST_RESULT = json_codec.dumps({"tools": mcp.list_tools()})
+
+# Request IDs only correlate logs and responses, so a per-process counter is
+# enough; the pid and a startup time salt keep workers and restarts apart.
+_REQUEST_ID_PREFIX = f"{os.getpid():x}-{time.time_ns() & 0xFFFF:04x}-"
+_next_request_number = itertools.count(1).__next__
+
+
+class FastJSONResponse(JSONResponse):
+    """`JSONResponse` encoded with `json_codec.dumps` (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
 
 
 @asynccontextmanager
@@ -96,113 +128,105 @@ app = FastAPI(
     description="Read-only Qortal tool surface for LLM agents.",
     version=APP_VERSION,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
 @app.middleware("http")
 async def add_request_context(request: Request, call_next):
-    request_id = str(uuid.uuid4())
+    request_id = f"{_REQUEST_ID_PREFIX}{_next_request_number():x}"
     request.state.request_id = request_id
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     default_metrics.incr_request()
     response = await call_next(request)
-    duration_ms = (time.time() - start) * 1000
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     default_metrics.record_duration(request_id, duration_ms)
     response.headers["X-Request-ID"] = request_id
     return response
 
 
-def _log_tool_result(tool_name: str, result: Dict[str, Any], request_id: Optional[str] = None) -> None:
-    if isinstance(result, dict) and result.get("error"):
-        logger.warning(
-            "tool=%s outcome=error error=%s request_id=%s",
-            tool_name,
-            result.get("error"),
-            request_id,
-            extra={"tool": tool_name, "request_id": request_id, "error": result.get("error")},
-        )
+def _log_tool_result(tool_name: str, result: Any, request_id: Optional[str] = None) -> None:
+    # List-returning tools (names, chat messages, trades) report errors as a
+    # dict, so the type check here is the only one a result goes through.
+    error = result.get("error") if isinstance(result, dict) else None
+    # Check the level first so filtered-out records skip building their args.
+    if error:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "tool=%s outcome=error error=%s request_id=%s",
+                tool_name,
+                error,
+                request_id,
+                extra={"tool": tool_name, "request_id": request_id, "error": error},
+            )
         default_metrics.record_tool(tool_name, success=False)
     else:
-        logger.info(
-            "tool=%s outcome=success request_id=%s",
-            tool_name,
-            request_id,
-            extra={"tool": tool_name, "request_id": request_id},
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "tool=%s outcome=success request_id=%s",
+                tool_name,
+                request_id,
+                extra={"tool": tool_name, "request_id": request_id},
+            )
         default_metrics.record_tool(tool_name, success=True)
 
 
-async def _enforce_rate_limit(tool_name: str) -> Optional[JSONResponse]:
+async def _enforce_rate_limit(tool_name: str) -> Optional[Response]:
     allowed = await rate_limiter.allow(tool_name)
     if not allowed:
         logger.warning("tool=%s outcome=rate_limited", tool_name)
         default_metrics.incr_rate_limited()
         # Return a JSON-RPC style error envelope for MCP clients.
-        return JSONResponse(
-            status_code=429,
-            content={"jsonrpc": "2.0", "error": {"code": 429, "message": "Rate limit exceeded"}},
-        )
+        return Response(content=_RATE_LIMITED_BODY, status_code=429, media_type="application/json")
     return None
 
 
+async def _call_tool(
+    request: Request, tool_name: str, tool: Callable[..., Awaitable[Any]], /, *args: Any, **kwargs: Any
+) -> Response:
+    """Rate-limit, run and log one tool call on behalf of its HTTP route."""
+    limited = await _enforce_rate_limit(tool_name)
+    if limited:
+        return limited
+    result = await tool(*args, **kwargs)
+    _log_tool_result(tool_name, result, getattr(request.state, "request_id", None))
+    return FastJSONResponse(content=result)
+
+
 @app.get("/health")
-async def health() -> JSONResponse:
+async def health() -> Response:
     """Lightweight health endpoint for monitoring."""
-    return JSONResponse(content=HEALTH_STATUS)
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/metrics")
 async def metrics() -> JSONResponse:
     """Return in-process metrics snapshot."""
-    return JSONResponse(content=default_metrics.snapshot())
+    return FastJSONResponse(content=default_metrics.snapshot())
 
 
 @app.get("/tools/node_status")
-async def node_status(request: Request) -> JSONResponse:
+async def node_status(request: Request) -> Response:
     """Proxy for get_node_status tool."""
-    limited = await _enforce_rate_limit("get_node_status")
-    if limited:
-        return limited
-    result = await get_node_status()
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_node_status", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_node_status", get_node_status)
 
 
 @app.get("/tools/node_info")
-async def node_info(request: Request) -> JSONResponse:
+async def node_info(request: Request) -> Response:
     """Proxy for get_node_info tool."""
-    limited = await _enforce_rate_limit("get_node_info")
-    if limited:
-        return limited
-    result = await get_node_info()
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_node_info", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_node_info", get_node_info)
 
 
 @app.get("/tools/node_summary")
-async def node_summary(request: Request) -> JSONResponse:
+async def node_summary(request: Request) -> Response:
     """Proxy for get_node_summary tool."""
-    limited = await _enforce_rate_limit("get_node_summary")
-    if limited:
-        return limited
-    result = await get_node_summary()
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_node_summary", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_node_summary", get_node_summary)
 
 
 @app.get("/tools/node_uptime")
-async def node_uptime(request: Request) -> JSONResponse:
+async def node_uptime(request: Request) -> Response:
     """Proxy for get_node_uptime tool."""
-    limited = await _enforce_rate_limit("get_node_uptime")
-    if limited:
-        return limited
-    result = await get_node_uptime()
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_node_uptime", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_node_uptime", get_node_uptime)
 
 
 @app.get("/tools/account_overview/{address}")
@@ -211,27 +235,22 @@ async def account_overview(
     request: Request,
     include_assets: bool | None = Query(False),
     asset_ids: List[int] | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for get_account_overview tool."""
-    limited = await _enforce_rate_limit("get_account_overview")
-    if limited:
-        return limited
-    result = await get_account_overview(address, include_assets=include_assets, asset_ids=asset_ids)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_account_overview", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(
+        request,
+        "get_account_overview",
+        get_account_overview,
+        address,
+        include_assets=include_assets,
+        asset_ids=asset_ids,
+    )
 
 
 @app.get("/tools/balance/{address}")
-async def balance(address: str, request: Request, assetId: int = 0) -> JSONResponse:
+async def balance(address: str, request: Request, assetId: int = 0) -> Response:
     """Proxy for get_balance tool."""
-    limited = await _enforce_rate_limit("get_balance")
-    if limited:
-        return limited
-    result = await get_balance(address, asset_id=assetId)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_balance", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_balance", get_balance, address, asset_id=assetId)
 
 
 @app.get("/tools/validate_address/{address}")
@@ -240,22 +259,17 @@ async def validate_address_route(address: str, request: Request) -> JSONResponse
     limited = await _enforce_rate_limit("validate_address")
     if limited:
         return limited
+    # A single anchored regex match (well under a microsecond): cheaper to run
+    # inline on the event loop than to hand off to the threadpool.
     result = validate_address(address)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("validate_address", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    _log_tool_result("validate_address", result, getattr(request.state, "request_id", None))
+    return FastJSONResponse(content=result)
 
 
 @app.get("/tools/name_info/{name}")
-async def name_info(name: str, request: Request) -> JSONResponse:
+async def name_info(name: str, request: Request) -> Response:
     """Proxy for get_name_info tool."""
-    limited = await _enforce_rate_limit("get_name_info")
-    if limited:
-        return limited
-    result = await get_name_info(name)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_name_info", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_name_info", get_name_info, name)
 
 
 @app.get("/tools/names_by_address/{address}")
@@ -265,27 +279,23 @@ async def names_by_address(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for get_names_by_address tool."""
-    limited = await _enforce_rate_limit("get_names_by_address")
-    if limited:
-        return limited
-    result = await get_names_by_address(address, limit=limit, offset=offset, reverse=reverse)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_names_by_address", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(
+        request,
+        "get_names_by_address",
+        get_names_by_address,
+        address,
+        limit=limit,
+        offset=offset,
+        reverse=reverse,
+    )
 
 
 @app.get("/tools/primary_name/{address}")
-async def primary_name(address: str, request: Request) -> JSONResponse:
+async def primary_name(address: str, request: Request) -> Response:
     """Proxy for get_primary_name tool."""
-    limited = await _enforce_rate_limit("get_primary_name")
-    if limited:
-        return limited
-    result = await get_primary_name(address)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_primary_name", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_primary_name", get_primary_name, address)
 
 
 @app.get("/tools/search_names")
@@ -296,15 +306,18 @@ async def search_names_route(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for search_names tool."""
-    limited = await _enforce_rate_limit("search_names")
-    if limited:
-        return limited
-    result = await search_names(query or "", prefix=prefix, limit=limit, offset=offset, reverse=reverse)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("search_names", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(
+        request,
+        "search_names",
+        search_names,
+        query or "",
+        prefix=prefix,
+        limit=limit,
+        offset=offset,
+        reverse=reverse,
+    )
 
 
 @app.get("/tools/list_names")
@@ -314,15 +327,9 @@ async def list_names_route(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for list_names tool."""
-    limited = await _enforce_rate_limit("list_names")
-    if limited:
-        return limited
-    result = await list_names(after=after, limit=limit, offset=offset, reverse=reverse)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("list_names", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "list_names", list_names, after=after, limit=limit, offset=offset, reverse=reverse)
 
 
 @app.get("/tools/list_names_for_sale")
@@ -331,39 +338,28 @@ async def list_names_for_sale_route(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for list_names_for_sale tool."""
-    limited = await _enforce_rate_limit("list_names_for_sale")
-    if limited:
-        return limited
-    result = await list_names_for_sale(limit=limit, offset=offset, reverse=reverse)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("list_names_for_sale", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(
+        request,
+        "list_names_for_sale",
+        list_names_for_sale,
+        limit=limit,
+        offset=offset,
+        reverse=reverse,
+    )
 
 
 @app.get("/tools/trade_offers")
-async def trade_offers(request: Request, limit: int | None = Query(None, ge=0)) -> JSONResponse:
+async def trade_offers(request: Request, limit: int | None = Query(None, ge=0)) -> Response:
     """Proxy for list_trade_offers tool."""
-    limited = await _enforce_rate_limit("list_trade_offers")
-    if limited:
-        return limited
-    result = await list_trade_offers(limit=limit)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("list_trade_offers", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "list_trade_offers", list_trade_offers, limit=limit)
 
 
 @app.get("/tools/hidden_trade_offers")
-async def hidden_trade_offers(request: Request, limit: int | None = Query(None, ge=0)) -> JSONResponse:
+async def hidden_trade_offers(request: Request, limit: int | None = Query(None, ge=0)) -> Response:
     """Proxy for list_hidden_trade_offers tool."""
-    limited = await _enforce_rate_limit("list_hidden_trade_offers")
-    if limited:
-        return limited
-    result = await list_hidden_trade_offers(limit=limit)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("list_hidden_trade_offers", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "list_hidden_trade_offers", list_hidden_trade_offers, limit=limit)
 
 
 @app.get("/tools/groups")
@@ -372,51 +368,27 @@ async def groups_route(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for list_groups tool."""
-    limited = await _enforce_rate_limit("list_groups")
-    if limited:
-        return limited
-    result = await list_groups(limit=limit, offset=offset, reverse=reverse)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("list_groups", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "list_groups", list_groups, limit=limit, offset=offset, reverse=reverse)
 
 
 @app.get("/tools/groups/owner/{address}")
-async def groups_by_owner(address: str, request: Request) -> JSONResponse:
+async def groups_by_owner(address: str, request: Request) -> Response:
     """Proxy for get_groups_by_owner tool."""
-    limited = await _enforce_rate_limit("get_groups_by_owner")
-    if limited:
-        return limited
-    result = await get_groups_by_owner(address=address)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_groups_by_owner", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_groups_by_owner", get_groups_by_owner, address=address)
 
 
 @app.get("/tools/groups/member/{address}")
-async def groups_by_member(address: str, request: Request) -> JSONResponse:
+async def groups_by_member(address: str, request: Request) -> Response:
     """Proxy for get_groups_by_member tool."""
-    limited = await _enforce_rate_limit("get_groups_by_member")
-    if limited:
-        return limited
-    result = await get_groups_by_member(address=address)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_groups_by_member", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_groups_by_member", get_groups_by_member, address=address)
 
 
 @app.get("/tools/group/{group_id}")
-async def group_detail(group_id: int, request: Request) -> JSONResponse:
+async def group_detail(group_id: int, request: Request) -> Response:
     """Proxy for get_group tool."""
-    limited = await _enforce_rate_limit("get_group")
-    if limited:
-        return limited
-    result = await get_group(group_id=group_id)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_group", get_group, group_id=group_id)
 
 
 @app.get("/tools/group/{group_id}/members")
@@ -427,70 +399,45 @@ async def group_members(
     limit: int | None = Query(None, ge=0),
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for get_group_members tool."""
-    limited = await _enforce_rate_limit("get_group_members")
-    if limited:
-        return limited
-    result = await get_group_members(
-        group_id=group_id, only_admins=onlyAdmins, limit=limit, offset=offset, reverse=reverse
+    return await _call_tool(
+        request,
+        "get_group_members",
+        get_group_members,
+        group_id=group_id,
+        only_admins=onlyAdmins,
+        limit=limit,
+        offset=offset,
+        reverse=reverse,
     )
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group_members", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
 
 
 @app.get("/tools/group_invites/address/{address}")
-async def group_invites_by_address(address: str, request: Request) -> JSONResponse:
+async def group_invites_by_address(address: str, request: Request) -> Response:
     """Proxy for get_group_invites_by_address tool."""
-    limited = await _enforce_rate_limit("get_group_invites_by_address")
-    if limited:
-        return limited
-    result = await get_group_invites_by_address(address=address)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group_invites_by_address", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_group_invites_by_address", get_group_invites_by_address, address=address)
 
 
 @app.get("/tools/group/{group_id}/invites")
-async def group_invites_by_group(group_id: int, request: Request) -> JSONResponse:
+async def group_invites_by_group(group_id: int, request: Request) -> Response:
     """Proxy for get_group_invites_by_group tool."""
-    limited = await _enforce_rate_limit("get_group_invites_by_group")
-    if limited:
-        return limited
-    result = await get_group_invites_by_group(group_id=group_id)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group_invites_by_group", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_group_invites_by_group", get_group_invites_by_group, group_id=group_id)
 
 
 @app.get("/tools/group/{group_id}/join_requests")
-async def group_join_requests(group_id: int, request: Request) -> JSONResponse:
+async def group_join_requests(group_id: int, request: Request) -> Response:
     """Proxy for get_group_join_requests tool."""
-    limited = await _enforce_rate_limit("get_group_join_requests")
-    if limited:
-        return limited
-    result = await get_group_join_requests(group_id=group_id)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group_join_requests", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_group_join_requests", get_group_join_requests, group_id=group_id)
 
 
 @app.get("/tools/group/{group_id}/bans")
-async def group_bans(group_id: int, request: Request) -> JSONResponse:
+async def group_bans(group_id: int, request: Request) -> Response:
     """Proxy for get_group_bans tool."""
-    limited = await _enforce_rate_limit("get_group_bans")
-    if limited:
-        return limited
-    result = await get_group_bans(group_id=group_id)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_group_bans", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_group_bans", get_group_bans, group_id=group_id)
 
 
-@app.get("/tools/chat/messages")
-async def chat_messages(
-    request: Request,
+def _chat_filters(
     txGroupId: int | None = Query(None),
     involving: List[str] | None = Query(None),
     before: int | None = Query(None),
@@ -504,84 +451,50 @@ async def chat_messages(
     offset: int | None = Query(None, ge=0),
     reverse: bool | None = Query(None),
     decode_text: bool | None = Query(None),
-) -> JSONResponse:
+) -> Dict[str, Any]:
+    """Query parameters shared by the chat message list and count routes."""
+    return {
+        "tx_group_id": txGroupId,
+        "involving": involving,
+        "before": before,
+        "after": after,
+        "reference": reference,
+        "chat_reference": chatreference,
+        "has_chat_reference": haschatreference,
+        "sender": sender,
+        "encoding": encoding,
+        "limit": limit,
+        "offset": offset,
+        "reverse": reverse,
+        "decode_text": decode_text,
+    }
+
+
+@app.get("/tools/chat/messages")
+async def chat_messages(request: Request, filters: Dict[str, Any] = Depends(_chat_filters)) -> Response:
     """Proxy for get_chat_messages tool."""
-    limited = await _enforce_rate_limit("get_chat_messages")
-    if limited:
-        return limited
-    result = await get_chat_messages(
-        tx_group_id=txGroupId,
-        involving=involving,
-        before=before,
-        after=after,
-        reference=reference,
-        chat_reference=chatreference,
-        has_chat_reference=haschatreference,
-        sender=sender,
-        encoding=encoding,
-        limit=limit,
-        offset=offset,
-        reverse=reverse,
-        decode_text=decode_text,
-    )
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_chat_messages", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "get_chat_messages", get_chat_messages, **filters)
 
 
 @app.get("/tools/chat/messages/count")
-async def chat_messages_count(
-    request: Request,
-    txGroupId: int | None = Query(None),
-    involving: List[str] | None = Query(None),
-    before: int | None = Query(None),
-    after: int | None = Query(None),
-    reference: str | None = Query(None),
-    chatreference: str | None = Query(None),
-    haschatreference: bool | None = Query(None),
-    sender: str | None = Query(None),
-    encoding: str | None = Query(None),
-    limit: int | None = Query(None, ge=0),
-    offset: int | None = Query(None, ge=0),
-    reverse: bool | None = Query(None),
-    decode_text: bool | None = Query(None),
-) -> JSONResponse:
+async def chat_messages_count(request: Request, filters: Dict[str, Any] = Depends(_chat_filters)) -> Response:
     """Proxy for count_chat_messages tool."""
-    limited = await _enforce_rate_limit("count_chat_messages")
-    if limited:
-        return limited
-    result = await count_chat_messages(
-        tx_group_id=txGroupId,
-        involving=involving,
-        before=before,
-        after=after,
-        reference=reference,
-        chat_reference=chatreference,
-        has_chat_reference=haschatreference,
-        sender=sender,
-        encoding=encoding,
-        limit=limit,
-        offset=offset,
-        reverse=reverse,
-        decode_text=decode_text,
-    )
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("count_chat_messages", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "count_chat_messages", count_chat_messages, **filters)
 
 
 @app.get("/tools/chat/message/{signature}")
 async def chat_message_by_signature(
     signature: str, request: Request, encoding: str | None = Query(None), decode_text: bool | None = Query(None)
-) -> JSONResponse:
+) -> Response:
     """Proxy for get_chat_message_by_signature tool."""
-    limited = await _enforce_rate_limit("get_chat_message_by_signature")
-    if limited:
-        return limited
-    result = await get_chat_message_by_signature(signature=signature, encoding=encoding, decode_text=decode_text)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_chat_message_by_signature", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(
+        request,
+        "get_chat_message_by_signature",
+        get_chat_message_by_signature,
+        signature=signature,
+        encoding=encoding,
+        decode_text=decode_text,
+    )
 
 
 @app.get("/tools/chat/active/{address}")
@@ -591,20 +504,17 @@ async def active_chats(
     encoding: str | None = Query(None),
     haschatreference: bool | None = Query(None),
     decode_text: bool | None = Query(None),
-) -> JSONResponse:
+) -> Response:
     """Proxy for get_active_chats tool."""
-    limited = await _enforce_rate_limit("get_active_chats")
-    if limited:
-        return limited
-    result = await get_active_chats(
+    return await _call_tool(
+        request,
+        "get_active_chats",
+        get_active_chats,
         address=address,
         encoding=encoding,
         has_chat_reference=haschatreference,
         decode_text=decode_text,
     )
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("get_active_chats", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
 
 
 @app.get("/tools/qdn_search")
@@ -613,19 +523,64 @@ async def qdn_search(
     address: str | None = None,
     service: int | None = Query(None, ge=0),
     limit: int | None = Query(None, ge=0),
-) -> JSONResponse:
+) -> Response:
     """Proxy for search_qdn tool."""
-    limited = await _enforce_rate_limit("search_qdn")
-    if limited:
-        return limited
-    result = await search_qdn(address=address, service=service, limit=limit)
-    request_id = getattr(request.state, "request_id", None)
-    _log_tool_result("search_qdn", result if isinstance(result, dict) else {}, request_id)
-    return JSONResponse(content=result)
+    return await _call_tool(request, "search_qdn", search_qdn, address=address, service=service, limit=limit)
+
+
+def _log_mcp_outcome(
+    rpc_id: Any,
+    start_ns: int,
+    request_id: Optional[str],
+    status_code: int,
+    *,
+    outcome: str,
+    method_label: Optional[str],
+    tool_label: Optional[str],
+    error_code: Optional[int],
+) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.debug(
+            "mcp outcome=%s method=%s tool=%s id=%s status=%s duration_ms=%.2f error_code=%s",
+            outcome,
+            method_label,
+            tool_label,
+            rpc_id,
+            status_code,
+            duration_ms,
+            error_code,
+            extra={"request_id": request_id, "tool": tool_label, "error": error_code},
+        )
+
+
+def _mcp_respond(
+    payload: Dict[str, Any],
+    start_ns: int,
+    request_id: Optional[str],
+    status_code: int = 200,
+    *,
+    outcome: str,
+    method_label: Optional[str] = None,
+    tool_label: Optional[str] = None,
+    error_code: Optional[int] = None,
+) -> JSONResponse:
+    """Log one MCP gateway outcome at debug level and wrap its JSON-RPC payload."""
+    _log_mcp_outcome(
+        payload.get("id"),
+        start_ns,
+        request_id,
+        status_code,
+        outcome=outcome,
+        method_label=method_label,
+        tool_label=tool_label,
+        error_code=error_code,
+    )
+    return FastJSONResponse(status_code=status_code, content=payload)
 
 
 @app.post("/mcp")
-async def mcp_gateway(request: Request) -> JSONResponse:
+async def mcp_gateway(request: Request) -> Response:
     """
     Minimal JSON-RPC-like gateway for MCP-style integrations.
 
@@ -635,32 +590,33 @@ async def mcp_gateway(request: Request) -> JSONResponse:
       - call_tool / tools/call
     """
     request_id = getattr(request.state, "request_id", None)
-    start_time = time.time()
-
-    def _respond(payload: Dict[str, Any], status_code: int = 200, *, outcome: str, method_label: Optional[str] = None, tool_label: Optional[str] = None, error_code: Optional[int] = None) -> JSONResponse:
-        duration_ms = (time.time() - start_time) * 1000
-        logger.debug(
-            "mcp outcome=%s method=%s tool=%s id=%s status=%s duration_ms=%.2f error_code=%s",
-            outcome,
-            method_label,
-            tool_label,
-            payload.get("id"),
-            status_code,
-            duration_ms,
-            error_code,
-            extra={"request_id": request_id, "tool": tool_label, "error": error_code},
-        )
-        return JSONResponse(status_code=status_code, content=payload)
+    start_ns = time.perf_counter_ns()
 
     try:
-        body = await request.json()
+        body = json_codec.loads(await request.body())
     except Exception:
         payload = _jsonrpc_error_payload(None, -32700, "Parse error", request_id=request_id)
-        return _respond(payload, status_code=400, outcome="error", method_label=None, error_code=-32700)
+        return _mcp_respond(
+            payload,
+            start_ns,
+            request_id,
+            status_code=400,
+            outcome="error",
+            method_label=None,
+            error_code=-32700,
+        )
 
     if not isinstance(body, dict):
         payload = _jsonrpc_error_payload(None, -32600, "Invalid request", request_id=request_id)
-        return _respond(payload, status_code=400, outcome="error", method_label=None, error_code=-32600)
+        return _mcp_respond(
+            payload,
+            start_ns,
+            request_id,
+            status_code=400,
+            outcome="error",
+            method_label=None,
+            error_code=-32600,
+        )
 
     method = body.get("method")
     rpc_id = body.get("id")
@@ -671,86 +627,142 @@ async def mcp_gateway(request: Request) -> JSONResponse:
         params = raw_params
     else:
         payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
-        return _respond(payload, outcome="error", method_label=method, error_code=-32602)
+        return _mcp_respond(payload, start_ns, request_id, outcome="error", method_label=method, error_code=-32602)
 
     if not method:
         payload = _jsonrpc_error_payload(rpc_id, -32600, "Invalid request", request_id=request_id)
-        return _respond(payload, outcome="error", method_label=None, error_code=-32600)
+        return _mcp_respond(payload, start_ns, request_id, outcome="error", method_label=None, error_code=-32600)
 
-    if method == "initialize":
-        protocol_version = params.get("protocolVersion")
-        if not isinstance(protocol_version, str) or not protocol_version:
-            payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
-            return _respond(payload, outcome="error", method_label=method, error_code=-32602)
+    handler = _MCP_METHODS.get(method) if isinstance(method, str) else None
+    if handler is None:
+        payload = _jsonrpc_error_payload(rpc_id, -32601, "Method not found", request_id=request_id)
+        return _mcp_respond(payload, start_ns, request_id, outcome="error", method_label=method, error_code=-32601)
+    return await handler(method, rpc_id, params, request_id, start_ns)
 
-        logger.debug(
-            "mcp initialize requested protocol=%s request_id=%s",
-            protocol_version,
+
+async def _mcp_initialize(
+    method: str, rpc_id: Any, params: Dict[str, Any], request_id: Optional[str], start_ns: int
+) -> Response:
+    protocol_version = params.get("protocolVersion")
+    if not isinstance(protocol_version, str) or not protocol_version:
+        payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
+        return _mcp_respond(
+            payload,
+            start_ns,
             request_id,
-            extra={"request_id": request_id},
-        )
-        result = {
-            "protocolVersion": protocol_version,
-            "serverInfo": {"name": MCP_SERVER_NAME, "version": MCP_SERVER_VERSION},
-            "capabilities": {"tools": {"listChanged": False}},
-        }
-        return _respond(
-            _jsonrpc_success_payload(rpc_id, result, request_id=request_id),
-            outcome="success",
+            outcome="error",
             method_label=method,
+            error_code=-32602,
         )
 
-    if method in ("list_tools", "tools/list"):
-        limited = await _enforce_rate_limit("list_tools")
-        if limited:
-            return limited
-        result = {"tools": mcp.list_tools()}
-        return _respond(
-            _jsonrpc_success_payload(rpc_id, result, request_id=request_id),
-            outcome="success",
+    logger.debug(
+        "mcp initialize requested protocol=%s request_id=%s",
+        protocol_version,
+        request_id,
+        extra={"request_id": request_id},
+    )
+    result = {
+        "protocolVersion": protocol_version,
+        "serverInfo": {"name": MCP_SERVER_NAME, "version": MCP_SERVER_VERSION},
+        "capabilities": {"tools": {"listChanged": False}},
+    }
+    return _mcp_respond(
+        _jsonrpc_success_payload(rpc_id, result, request_id=request_id),
+        start_ns,
+        request_id,
+        outcome="success",
+        method_label=method,
+    )
+
+
+async def _mcp_list_tools(
+    method: str, rpc_id: Any, params: Dict[str, Any], request_id: Optional[str], start_ns: int
+) -> Response:
+    limited = await _enforce_rate_limit("list_tools")
+    if limited:
+        return limited
+    _log_mcp_outcome(
+        rpc_id,
+        start_ns,
+        request_id,
+        200,
+        outcome="success",
+        method_label=method,
+        tool_label=None,
+        error_code=None,
+    )
+    body = b"".join((b'{"jsonrpc":"2.0","id":', json_codec.dumps(rpc_id), b',"result":', _TOOLS_LIST_RESULT, b"}"))
+    return Response(content=body, media_type="application/json")
+
+
+async def _mcp_call_tool(
+    method: str, rpc_id: Any, params: Dict[str, Any], request_id: Optional[str], start_ns: int
+) -> Response:
+    tool_name = params.get("tool") or params.get("name")
+    tool_params = params.get("params")
+    if tool_params is None:
+        tool_params = params.get("arguments") or {}
+    if not isinstance(tool_name, str) or not tool_name.strip():
+        payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
+        return _mcp_respond(
+            payload,
+            start_ns,
+            request_id,
+            outcome="error",
             method_label=method,
+            tool_label=None,
+            error_code=-32602,
         )
-
-    if method in ("call_tool", "tools/call"):
-        tool_name = params.get("tool") or params.get("name")
-        tool_params = params.get("params")
-        if tool_params is None:
-            tool_params = params.get("arguments") or {}
-        if not isinstance(tool_name, str) or not tool_name.strip():
-            payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
-            return _respond(
-                payload,
-                outcome="error",
-                method_label=method,
-                tool_label=None,
-                error_code=-32602,
-            )
-        if not isinstance(tool_params, dict):
-            payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
-            return _respond(payload, outcome="error", method_label=method, tool_label=tool_name, error_code=-32602)
-        limited = await _enforce_rate_limit(tool_name or "call_tool")
-        if limited:
-            return limited
-        result = await mcp.call_tool(tool_name, tool_params)
-        wrapped = _wrap_tool_result(result)
-        return _respond(
-            _jsonrpc_success_payload(rpc_id, wrapped, request_id=request_id),
-            outcome="success",
+    if not isinstance(tool_params, dict):
+        payload = _jsonrpc_error_payload(rpc_id, -32602, "Invalid params", request_id=request_id)
+        return _mcp_respond(
+            payload,
+            start_ns,
+            request_id,
+            outcome="error",
             method_label=method,
             tool_label=tool_name,
+            error_code=-32602,
         )
+    limited = await _enforce_rate_limit(tool_name or "call_tool")
+    if limited:
+        return limited
+    result = await mcp.call_tool(tool_name, tool_params)
+    _log_mcp_outcome(
+        rpc_id,
+        start_ns,
+        request_id,
+        200,
+        outcome="success",
+        method_label=method,
+        tool_label=tool_name,
+        error_code=None,
+    )
+    return Response(content=_tool_result_body(rpc_id, result), media_type="application/json")
 
-    if method in ("notifications/initialized", "initialized"):
-        # Notifications should not return a JSON-RPC response body.
-        logger.debug(
-            "mcp initialized notification received request_id=%s",
-            request_id,
-            extra={"request_id": request_id},
-        )
-        return Response(status_code=204)
 
-    payload = _jsonrpc_error_payload(rpc_id, -32601, "Method not found", request_id=request_id)
-    return _respond(payload, outcome="error", method_label=method, error_code=-32601)
+async def _mcp_initialized(
+    method: str, rpc_id: Any, params: Dict[str, Any], request_id: Optional[str], start_ns: int
+) -> Response:
+    # Notifications should not return a JSON-RPC response body.
+    logger.debug(
+        "mcp initialized notification received request_id=%s",
+        request_id,
+        extra={"request_id": request_id},
+    )
+    return Response(status_code=204)
+
+
+# JSON-RPC method name -> handler; aliases map to the same handler.
+_MCP_METHODS: Dict[str, Callable[[str, Any, Dict[str, Any], Optional[str], int], Awaitable[Response]]] = {
+    "initialize": _mcp_initialize,
+    "list_tools": _mcp_list_tools,
+    "tools/list": _mcp_list_tools,
+    "call_tool": _mcp_call_tool,
+    "tools/call": _mcp_call_tool,
+    "notifications/initialized": _mcp_initialized,
+    "initialized": _mcp_initialized,
+}
 
 
 # Run with: uvicorn qortal_mcp.server:app --reload
@@ -782,7 +794,10 @@ def _wrap_tool_result(result: Any) -> Dict[str, Any]:
 
     # For structured or primitive outputs, provide a text rendering plus structuredContent.
     try:
-        text_repr = json.dumps(result, ensure_ascii=True)
+        text_repr = json_codec.dumps(result).decode()
+        if not text_repr.isascii():
+            # Keep the text rendering ASCII-only, as it always has been.
+            text_repr = json.dumps(result, ensure_ascii=True, separators=(",", ":"))
     except Exception:
         text_repr = str(result)
     wrapped_result: Dict[str, Any] = {
@@ -790,3 +805,35 @@ def _wrap_tool_result(result: Any) -> Dict[str, Any]:
         "structuredContent": result,
     }
     return wrapped_result
+
+
+def _tool_result_body(rpc_id: Any, result: Any) -> bytes:
+    """
+    Encode the JSON-RPC response for a tool call.
+
+    Structured results are encoded once and the bytes are reused for both the
+    text rendering and `structuredContent`, instead of serializing the result
+    twice. The output is identical to encoding `_wrap_tool_result` in a
+    success envelope, which remains the path for errors and plain strings.
+    """
+    dumps = json_codec.dumps
+    if isinstance(result, str) or (isinstance(result, dict) and "error" in result):
+        return dumps(_jsonrpc_success_payload(rpc_id, _wrap_tool_result(result)))
+    try:
+        encoded = dumps(result)
+    except Exception:
+        return dumps(_jsonrpc_success_payload(rpc_id, _wrap_tool_result(result)))
+    text_repr = encoded.decode()
+    if not text_repr.isascii():
+        text_repr = json.dumps(result, ensure_ascii=True, separators=(",", ":"))
+    return b"".join(
+        (
+            b'{"jsonrpc":"2.0","id":',
+            dumps(rpc_id),
+            b',"result":{"content":[{"type":"text","text":',
+            dumps(text_repr),
+            b'}],"structuredContent":',
+            encoded,
+            b"}}",
+        )
+    )
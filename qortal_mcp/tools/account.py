@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from qortal_mcp.config import QortalConfig, default_config
@@ -44,6 +46,13 @@ def _normalize_balance(balance_payload: Any) -> str:
     return str(balance_value)
 
 
+def _unwrap(result: Any) -> Any:
+    """Re-raise an exception captured by `asyncio.gather(return_exceptions=True)`."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 def _extract_names(raw_names: Any, max_items: int) -> List[str]:
     names: List[str] = []
     source = raw_names
@@ -51,14 +60,15 @@ def _extract_names(raw_names: Any, max_items: int) -> List[str]:
         source = raw_names.get("names")
 
     if isinstance(source, list):
-        for item in source[:max_items]:
+        # At most one name per item, so bounding the items bounds the output.
+        for item in islice(source, max(max_items, 0)):
             if isinstance(item, dict):
                 name_value = item.get("name")
                 if isinstance(name_value, str):
                     names.append(name_value)
             elif isinstance(item, str):
                 names.append(item)
-    return names[:max_items]
+    return names
 
 
 async def _resolve_asset_name(client, asset_id: int) -> Optional[str]:
@@ -73,6 +83,21 @@ async def _resolve_asset_name(client, asset_id: int) -> Optional[str]:
     return None
 
 
+async def _fetch_asset_entry(client, address: str, asset_id: int) -> Dict[str, Any]:
+    """Fetch one asset balance and its name concurrently; balance errors propagate."""
+    raw_balance, name = await asyncio.gather(
+        client.fetch_address_balance(address, asset_id=asset_id),
+        _resolve_asset_name(client, asset_id),
+    )
+    entry: Dict[str, Any] = {
+        "assetId": asset_id,
+        "balance": _normalize_balance(raw_balance),
+    }
+    if name:
+        entry["name"] = name
+    return entry
+
+
 async def _fetch_asset_balances(
     *,
     client,
@@ -86,21 +111,18 @@ async def _fetch_asset_balances(
     if asset_ids is not None and parsed_ids is None:
         return {"error": "Invalid asset_ids; must be 1 to %d integers." % max_assets}
 
-    # If explicit IDs provided
+    # If explicit IDs provided, look every asset up concurrently; results are
+    # then mapped in request order so the first fatal error still wins.
     if parsed_ids:
+        selected_ids = parsed_ids[:max_assets]
+        outcomes = await asyncio.gather(
+            *(_fetch_asset_entry(client, address, asset_id) for asset_id in selected_ids),
+            return_exceptions=True,
+        )
         balances: List[Dict[str, Any]] = []
-        for asset_id in parsed_ids[:max_assets]:
+        for asset_id, outcome in zip(selected_ids, outcomes):
             try:
-                raw_balance = await client.fetch_address_balance(address, asset_id=asset_id)
-                balance_str = _normalize_balance(raw_balance)
-                name = await _resolve_asset_name(client, asset_id)
-                entry: Dict[str, Any] = {
-                    "assetId": asset_id,
-                    "balance": balance_str,
-                }
-                if name:
-                    entry["name"] = name
-                balances.append(entry)
+                balances.append(_unwrap(outcome))
             except InvalidAddressError:
                 return [{"error": "Invalid Qortal address."}]
             except AddressNotFoundError:
@@ -152,9 +174,10 @@ async def _fetch_asset_balances(
             normalized_balance = _normalize_balance(balance_value)
             results.append({"assetId": parsed_asset_id, "balance": normalized_balance})
 
-    # Optionally resolve names for the collected asset IDs
-    for item in results:
-        name = await _resolve_asset_name(client, item["assetId"])
+    # Resolve names for the collected asset IDs concurrently; lookups that
+    # fail resolve to None, so the entry is simply left unnamed.
+    names = await asyncio.gather(*(_resolve_asset_name(client, item["assetId"]) for item in results))
+    for item, name in zip(results, names):
         if name:
             item["name"] = name
 
@@ -182,9 +205,32 @@ async def get_account_overview(
     """
     if not is_valid_qortal_address(address):
         return {"error": "Invalid Qortal address."}
+    if include_assets and asset_ids is not None:
+        if parse_int_list(asset_ids, max_items=config.max_asset_overview) is None:
+            return {"error": "Invalid asset_ids; must be 1 to %d integers." % config.max_asset_overview}
+
+    # The lookups are independent, so they share one round trip of latency;
+    # errors are then handled in the order the view depends on them.
+    lookups = [
+        client.fetch_address_info(address),
+        client.fetch_address_balance(address, asset_id=0),
+        client.fetch_names_by_owner(address),
+    ]
+    if include_assets:
+        lookups.append(
+            _fetch_asset_balances(
+                client=client,
+                address=address,
+                asset_ids=asset_ids,
+                config=config,
+            )
+        )
+    info_result, balance_result, names_result, *assets_outcome = await asyncio.gather(
+        *lookups, return_exceptions=True
+    )
 
     try:
-        account_info = await client.fetch_address_info(address)
+        account_info = _unwrap(info_result)
     except InvalidAddressError:
         return {"error": "Invalid Qortal address."}
     except AddressNotFoundError:
@@ -200,8 +246,7 @@ async def get_account_overview(
         return {"error": "Unexpected error while retrieving account data."}
 
     try:
-        balance_payload = await client.fetch_address_balance(address, asset_id=0)
-        balance = _normalize_balance(balance_payload)
+        balance = _normalize_balance(_unwrap(balance_result))
     except InvalidAddressError:
         return {"error": "Invalid Qortal address."}
     except AddressNotFoundError:
@@ -218,8 +263,7 @@ async def get_account_overview(
 
     names: List[str] = []
     try:
-        names_payload = await client.fetch_names_by_owner(address)
-        names = _extract_names(names_payload, config.max_names)
+        names = _extract_names(_unwrap(names_result), config.max_names)
     except (InvalidAddressError, AddressNotFoundError):
         # Should not happen due to prior validation, but fail gracefully.
         names = []
@@ -236,13 +280,8 @@ async def get_account_overview(
         names = []
 
     asset_balances: List[Dict[str, Any]] = []
-    if include_assets:
-        assets_result = await _fetch_asset_balances(
-            client=client,
-            address=address,
-            asset_ids=asset_ids,
-            config=config,
-        )
+    if assets_outcome:
+        assets_result = _unwrap(assets_outcome[0])
         if isinstance(assets_result, dict) and assets_result.get("error"):
             return assets_result
         if isinstance(assets_result, list):
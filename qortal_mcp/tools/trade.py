@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
 from typing import Any, Dict, List, Optional
@@ -279,13 +280,30 @@ async def list_completed_trades(
     return results[:effective_limit]
 
 
+def _end_of_lines(text: str, count: int) -> int:
+    """Return the index just past the `count`-th newline in text, or -1."""
+    index = 0
+    for _ in range(count):
+        index = text.find("\n", index) + 1
+        if index == 0:
+            return -1
+    return index
+
+
 async def get_trade_ledger(
     *,
     public_key: str,
     minimum_timestamp: Optional[int] = None,
     client=default_client,
+    config: QortalConfig = default_config,
 ) -> Dict[str, Any]:
-    """Fetch trade ledger entries CSV for a public key (returns raw payload)."""
+    """
+    Fetch trade ledger entries CSV for a public key.
+
+    The CSV is streamed from the node and returned verbatim, line endings
+    included. It is cut off after `config.max_trade_ledger_lines` lines
+    (header included), in which case `truncated` is set.
+    """
     if not public_key or not isinstance(public_key, str):
         return {"error": "Public key is required."}
     if not _is_base58(public_key, min_len=43, max_len=45):
@@ -297,8 +315,23 @@ async def get_trade_ledger(
             return {"error": "Invalid minimumTimestamp."}
         if minimum_timestamp <= 0:
             return {"error": "Invalid minimumTimestamp."}
+    parts: List[str] = []
+    lines_left = config.max_trade_ledger_lines
+    truncated = False
     try:
-        raw = await client.fetch_trade_ledger(public_key=public_key, minimum_timestamp=minimum_timestamp)
+        stream = client.stream_trade_ledger(public_key=public_key, minimum_timestamp=minimum_timestamp)
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                cut = _end_of_lines(chunk, lines_left)
+                if cut < 0:
+                    parts.append(chunk)
+                    lines_left -= chunk.count("\n")
+                    continue
+                parts.append(chunk[:cut])
+                if cut < len(chunk):
+                    truncated = True
+                    break
+                lines_left = 0
     except UnauthorizedError:
         return {"error": "Unauthorized or API key required."}
     except NodeUnreachableError:
@@ -309,7 +342,10 @@ async def get_trade_ledger(
         logger.exception("Unexpected error fetching trade ledger for %s", public_key)
         return {"error": "Unexpected error while retrieving trade ledger."}
 
-    return raw if isinstance(raw, dict) else {"ledger": raw}
+    result: Dict[str, Any] = {"ledger": "".join(parts)}
+    if truncated:
+        result["truncated"] = True
+    return result
 
 
 async def get_trade_price(
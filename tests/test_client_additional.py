@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from qortal_mcp.qortal_api.client import (
@@ -144,6 +146,14 @@ async def test_block_height_by_signature_unexpected_response():
         await client.fetch_block_height_by_signature("s" * 44)
 
 
+@pytest.mark.asyncio
+async def test_block_height_by_signature_rejects_non_integer_json():
+    mock = MockAsyncClient([MockResponse(200, {"height": 5})])
+    client = QortalApiClient(async_client=mock)
+    with pytest.raises(QortalApiError):
+        await client.fetch_block_height_by_signature("s" * 44)
+
+
 @pytest.mark.asyncio
 async def test_name_not_found_mapping():
     mock = MockAsyncClient([MockResponse(404, {"error": "NAME_UNKNOWN"})])
@@ -217,3 +227,79 @@ async def test_search_qdn_unexpected_response():
     client = QortalApiClient(async_client=mock)
     result = await client.search_qdn(limit=1)
     assert result == "not-a-list"
+
+
+@pytest.mark.asyncio
+async def test_client_decodes_real_httpx_response_bytes():
+    import httpx
+
+    def handler(request):
+        return httpx.Response(200, content=b'[{"name": "alice"}]', headers={"Content-Type": "application/json"})
+
+    async_client = httpx.AsyncClient(base_url="http://node", transport=httpx.MockTransport(handler))
+    client = QortalApiClient(async_client=async_client)
+    assert await client.fetch_names_for_sale() == [{"name": "alice"}]
+    await async_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_bounded_by_connection_limit():
+    from qortal_mcp.config import QortalConfig
+
+    class SlowClient:
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+
+        async def get(self, path, params=None, headers=None):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return MockResponse(200, [])
+
+        async def aclose(self):
+            return None
+
+    slow = SlowClient()
+    config = QortalConfig(http_max_connections=2, response_cache_size=0)
+    client = QortalApiClient(config=config, async_client=slow)
+    await asyncio.gather(*(client.fetch_transactions_by_address("Q" * 34, limit=i) for i in range(6)))
+    assert slow.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_trade_ledger_yields_body_and_maps_errors():
+    import httpx
+
+    def handler(request):
+        if request.url.path.endswith("missing"):
+            return httpx.Response(401, json={"error": 9})
+        assert request.url.params["minimumTimestamp"] == "5"
+        return httpx.Response(200, content=b"a,b\r\n1,2\r\n3,4\r\n")
+
+    async_client = httpx.AsyncClient(base_url="http://node", transport=httpx.MockTransport(handler))
+    client = QortalApiClient(async_client=async_client)
+    chunks = [chunk async for chunk in client.stream_trade_ledger(public_key="pk", minimum_timestamp=5)]
+    assert "".join(chunks) == "a,b\r\n1,2\r\n3,4\r\n"
+    with pytest.raises(UnauthorizedError):
+        async for _chunk in client.stream_trade_ledger(public_key="missing"):
+            pass
+    await async_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_boolean_params_sent_lowercase():
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url.query, "ascii") if isinstance(request.url.query, bytes) else request.url.query)
+        return httpx.Response(200, json=[])
+
+    async_client = httpx.AsyncClient(base_url="http://node", transport=httpx.MockTransport(handler))
+    client = QortalApiClient(async_client=async_client)
+    await client.fetch_asset_balances(addresses=["Q1"], exclude_zero=True, reverse=False)
+    assert seen == ["address=Q1&excludeZero=true&reverse=false"]
+    await async_client.aclose()
@@ -0,0 +1,171 @@
+import pytest
+
+pytest.importorskip("diskcache")
+
+from qortal_mcp.config import QortalConfig
+from qortal_mcp.qortal_api.client import QortalApiClient
+
+
+class MockResponse:
+    def __init__(self, status_code: int, json_body=None):
+        self.status_code = status_code
+        self._json = json_body
+        self.text = ""
+
+    def json(self):
+        if self._json is None:
+            raise ValueError("no json")
+        return self._json
+
+
+class RoutingAsyncClient:
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    async def get(self, path, params=None, headers=None):
+        self.calls.append(path)
+        return MockResponse(200, self.routes[path])
+
+    async def aclose(self):
+        return None
+
+
+def _config(tmp_path, base_url="http://node"):
+    return QortalConfig(
+        base_url=base_url,
+        disk_cache_dir=str(tmp_path),
+        disk_cache_min_confirmations=10,
+        response_cache_size=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_deep_block_survives_client_restart(tmp_path):
+    routes = {"/blocks/byheight/100": {"height": 100, "signature": "sig"}, "/blocks/height": 500}
+    first = RoutingAsyncClient(routes)
+    client = QortalApiClient(config=_config(tmp_path), async_client=first)
+    assert await client.fetch_block_by_height(100) == {"height": 100, "signature": "sig"}
+    await client.aclose()
+
+    second = RoutingAsyncClient(routes)
+    restarted = QortalApiClient(config=_config(tmp_path), async_client=second)
+    assert await restarted.fetch_block_by_height(100) == {"height": 100, "signature": "sig"}
+    assert second.calls == []
+    await restarted.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shallow_transaction_not_persisted(tmp_path):
+    routes = {"/transactions/signature/abc": {"blockHeight": 495}, "/blocks/height": 500}
+    mock = RoutingAsyncClient(routes)
+    client = QortalApiClient(config=_config(tmp_path), async_client=mock)
+    await client.fetch_transaction_by_signature("abc")
+    await client.fetch_transaction_by_signature("abc")
+    assert mock.calls.count("/transactions/signature/abc") == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_mutable_paths_bypass_disk_cache(tmp_path):
+    routes = {"/blocks/last": {"height": 10}}
+    mock = RoutingAsyncClient(routes)
+    client = QortalApiClient(config=_config(tmp_path), async_client=mock)
+    await client.fetch_last_block()
+    await client.fetch_last_block()
+    assert mock.calls == ["/blocks/last", "/blocks/last"]
+    await client.aclose()
+
+
+def _pool_config(tmp_path):
+    return QortalConfig(
+        base_url="http://primary",
+        public_nodes=["http://fallback"],
+        allow_public_fallback=True,
+        disk_cache_dir=str(tmp_path),
+        disk_cache_min_confirmations=10,
+        response_cache_size=0,
+    )
+
+
+def _mock_transport_clients(monkeypatch, handler):
+    import httpx
+
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda base_url, timeout, **_kwargs: real_async_client(
+            base_url=base_url, timeout=timeout, transport=httpx.MockTransport(handler)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_served_block_is_never_persisted(tmp_path, monkeypatch):
+    import httpx
+
+    def handler(request):
+        if request.url.host == "primary":
+            raise httpx.ConnectError("primary down")
+        if request.url.path == "/blocks/height":
+            return httpx.Response(200, json=500)
+        return httpx.Response(200, json={"height": 100, "signature": "forged"})
+
+    _mock_transport_clients(monkeypatch, handler)
+    client = QortalApiClient(config=_pool_config(tmp_path))
+    assert await client.fetch_block_by_height(100) == {"height": 100, "signature": "forged"}
+    await client.aclose()
+
+    routes = {"/blocks/byheight/100": {"height": 100, "signature": "sig"}, "/blocks/height": 500}
+    restarted_mock = RoutingAsyncClient(routes)
+    restarted = QortalApiClient(config=_config(tmp_path, "http://primary"), async_client=restarted_mock)
+    assert await restarted.fetch_block_by_height(100) == {"height": 100, "signature": "sig"}
+    assert "/blocks/byheight/100" in restarted_mock.calls
+    await restarted.aclose()
+
+
+@pytest.mark.asyncio
+async def test_confirmation_height_only_comes_from_trusted_node(tmp_path, monkeypatch):
+    import httpx
+
+    def handler(request):
+        if request.url.path == "/blocks/height":
+            if request.url.host == "primary":
+                raise httpx.ConnectError("primary height unavailable")
+            return httpx.Response(200, json=500)
+        return httpx.Response(200, json={"height": 100, "signature": "sig"})
+
+    _mock_transport_clients(monkeypatch, handler)
+    client = QortalApiClient(config=_pool_config(tmp_path))
+    await client.fetch_block_by_height(100)
+    await client.aclose()
+
+    restarted_mock = RoutingAsyncClient({"/blocks/byheight/100": {"height": 100, "signature": "sig"}, "/blocks/height": 500})
+    restarted = QortalApiClient(config=_config(tmp_path, "http://primary"), async_client=restarted_mock)
+    await restarted.fetch_block_by_height(100)
+    assert "/blocks/byheight/100" in restarted_mock.calls
+    await restarted.aclose()
+
+
+@pytest.mark.asyncio
+async def test_trusted_primary_block_is_persisted_with_pool(tmp_path, monkeypatch):
+    import httpx
+
+    def handler(request):
+        if request.url.host != "primary":
+            raise httpx.ConnectError("fallback unused")
+        if request.url.path == "/blocks/height":
+            return httpx.Response(200, json=500)
+        return httpx.Response(200, json={"height": 100, "signature": "sig"})
+
+    _mock_transport_clients(monkeypatch, handler)
+    client = QortalApiClient(config=_pool_config(tmp_path))
+    await client.fetch_block_by_height(100)
+    await client.aclose()
+
+    restarted_mock = RoutingAsyncClient({})
+    restarted = QortalApiClient(config=_config(tmp_path, "http://primary"), async_client=restarted_mock)
+    assert await restarted.fetch_block_by_height(100) == {"height": 100, "signature": "sig"}
+    assert restarted_mock.calls == []
+    await restarted.aclose()
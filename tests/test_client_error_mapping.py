@@ -1,3 +1,4 @@
+import httpx
 import pytest
 
 from qortal_mcp.qortal_api.client import (
@@ -113,6 +114,24 @@ async def test_path_encoding_and_params(monkeypatch):
     assert captured["params"]["assetId"] == 7
 
 
+@pytest.mark.asyncio
+async def test_default_balance_params_are_prebuilt():
+    captured = {}
+
+    class CaptureClient:
+        async def get(self, path, params=None, headers=None):
+            captured["params"] = params
+            return MockResponse(200, {})
+
+        async def aclose(self):
+            return None
+
+    client = QortalApiClient(async_client=CaptureClient())
+    await client.fetch_address_balance("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV")
+    assert isinstance(captured["params"], httpx.QueryParams)
+    assert str(captured["params"]) == "assetId=0"
+
+
 @pytest.mark.asyncio
 async def test_api_key_header_added():
     captured = {}
@@ -181,3 +200,22 @@ async def test_request_error_maps_to_node_unreachable():
     client = QortalApiClient(async_client=FailClient())
     with pytest.raises(NodeUnreachableError):
         await client.fetch_node_status()
+
+
+def test_quote_path_matches_urllib_quote():
+    from urllib.parse import quote
+
+    from qortal_mcp.qortal_api.client import _quote_path
+
+    for segment in ("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", "name with space", "a/b", "x_y.z~-", "ünï"):
+        assert _quote_path(segment) == quote(segment, safe="")
+
+
+def test_build_headers_reuses_shared_mappings():
+    client = QortalApiClient(config=QortalConfig(api_key="secret"), async_client=object())
+    anonymous = client._build_headers(use_api_key=False, trusted=True)
+    assert anonymous == {}
+    assert anonymous is client._build_headers(use_api_key=True, trusted=False)
+    auth = client._build_headers(use_api_key=True, trusted=True)
+    assert auth == {"X-API-KEY": "secret"}
+    assert auth is client._build_headers(use_api_key=True, trusted=True)
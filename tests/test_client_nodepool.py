@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 import httpx
@@ -48,7 +50,7 @@ async def test_nodepool_fallback_success(monkeypatch):
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda base_url, timeout: DummyAsyncClient(base_url, timeout, behavior),
+        lambda base_url, timeout, **_kwargs: DummyAsyncClient(base_url, timeout, behavior),
     )
 
     cfg = QortalConfig(
@@ -78,7 +80,7 @@ async def test_nodepool_all_nodes_unreachable(monkeypatch):
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda base_url, timeout: DummyAsyncClient(base_url, timeout, behavior),
+        lambda base_url, timeout, **_kwargs: DummyAsyncClient(base_url, timeout, behavior),
     )
 
     cfg = QortalConfig(
@@ -107,7 +109,7 @@ async def test_nodepool_admin_unauthorized_on_fallback(monkeypatch):
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda base_url, timeout: DummyAsyncClient(base_url, timeout, behavior),
+        lambda base_url, timeout, **_kwargs: DummyAsyncClient(base_url, timeout, behavior),
     )
 
     cfg = QortalConfig(
@@ -141,7 +143,7 @@ async def test_nodepool_skips_primary_after_failure_in_same_session(monkeypatch)
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda base_url, timeout: DummyAsyncClient(base_url, timeout, behavior),
+        lambda base_url, timeout, **_kwargs: DummyAsyncClient(base_url, timeout, behavior),
     )
 
     cfg = QortalConfig(
@@ -179,7 +181,7 @@ async def test_nodepool_health_check_recovers_primary(monkeypatch):
     monkeypatch.setattr(
         httpx,
         "AsyncClient",
-        lambda base_url, timeout: DummyAsyncClient(base_url, timeout, behavior),
+        lambda base_url, timeout, **_kwargs: DummyAsyncClient(base_url, timeout, behavior),
     )
     monkeypatch.setattr("qortal_mcp.qortal_api.client.time.monotonic", fake_monotonic)
 
@@ -206,3 +208,237 @@ async def test_nodepool_health_check_recovers_primary(monkeypatch):
     assert calls[-1] == ("http://primary", "/admin/status")
 
     await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_nodepool_clients_use_configured_limits(monkeypatch):
+    created = []
+
+    def factory(base_url, timeout, **kwargs):
+        created.append(kwargs)
+        return DummyAsyncClient(base_url, timeout, lambda *_args: DummyResponse(200, {"ok": True}))
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+
+    cfg = QortalConfig(
+        base_url="http://primary",
+        public_nodes=["http://fallback"],
+        allow_public_fallback=True,
+        http_max_connections=7,
+        http_max_keepalive_connections=3,
+    )
+    client = QortalApiClient(config=cfg)
+    await client.fetch_node_status()
+
+    limits = created[0]["limits"]
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 3
+    assert created[0]["headers"]["Accept-Encoding"].startswith("gzip")
+    assert created[0]["headers"]["User-Agent"].startswith("qortal-mcp-server/")
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_nodepool_hedges_slow_primary(monkeypatch):
+    cancelled = []
+
+    class SlowPrimaryClient(DummyAsyncClient):
+        async def get(self, path, params=None, headers=None, **_kwargs):
+            if self.base_url == "http://primary":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(self.base_url)
+                    raise
+            return DummyResponse(200, {"node": self.base_url})
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda base_url, timeout, **_kwargs: SlowPrimaryClient(base_url, timeout, None),
+    )
+
+    cfg = QortalConfig(
+        base_url="http://primary",
+        public_nodes=["http://fallback"],
+        allow_public_fallback=True,
+        fallback_hedge_after_seconds=0.01,
+    )
+    client = QortalApiClient(config=cfg)
+
+    result = await asyncio.wait_for(client.fetch_block_height(), timeout=1)
+    assert result == {"node": "http://fallback"}
+    assert cancelled == ["http://primary"]
+
+    await client.aclose()
+
+
+def _mock_transport_clients(monkeypatch, handler):
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda base_url, timeout, **_kwargs: real_async_client(
+            base_url=base_url, timeout=timeout, transport=httpx.MockTransport(handler)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_nodepool_fallback_error_does_not_beat_primary_success(monkeypatch):
+    async def handler(request):
+        if request.url.host == "primary":
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"height": 5, "node": "primary"})
+        return httpx.Response(404, json={"error": "BLOCK_UNKNOWN"})
+
+    _mock_transport_clients(monkeypatch, handler)
+    cfg = QortalConfig(
+        base_url="http://primary",
+        public_nodes=["http://fallback"],
+        allow_public_fallback=True,
+        fallback_hedge_after_seconds=0.01,
+    )
+    client = QortalApiClient(config=cfg)
+
+    result = await asyncio.wait_for(client.fetch_block_by_height(5), timeout=1)
+    assert result == {"height": 5, "node": "primary"}
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_nodepool_fallback_error_raised_when_last_outstanding(monkeypatch):
+    from qortal_mcp.qortal_api.client import QortalApiError
+
+    async def handler(request):
+        if request.url.host == "primary":
+            await asyncio.sleep(0.05)
+            raise httpx.ConnectError("primary down")
+        return httpx.Response(404, json={"error": "BLOCK_UNKNOWN"})
+
+    _mock_transport_clients(monkeypatch, handler)
+    cfg = QortalConfig(
+        base_url="http://primary",
+        public_nodes=["http://fallback"],
+        allow_public_fallback=True,
+        fallback_hedge_after_seconds=0.01,
+    )
+    client = QortalApiClient(config=cfg)
+
+    with pytest.raises(QortalApiError) as excinfo:
+        await asyncio.wait_for(client.fetch_block_by_height(5), timeout=1)
+    assert not isinstance(excinfo.value, NodeUnreachableError)
+    assert excinfo.value.status_code == 404
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_nodepool_concurrent_dispatch_shares_probe(monkeypatch):
+    from qortal_mcp.qortal_api.client import NodePool
+
+    probes = []
+
+    class SlowProbeClient(DummyAsyncClient):
+        async def get(self, path, params=None, headers=None, **_kwargs):
+            probes.append(self.base_url)
+            await asyncio.sleep(0.01)
+            return DummyResponse(200, 1)
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda base_url, timeout, **_kwargs: SlowProbeClient(base_url, timeout, None),
+    )
+    pool = NodePool(
+        ["http://primary", "http://fallback"],
+        timeout=1,
+        cooldown_seconds=0,
+        health_check_path="/blocks/height",
+    )
+    pool.report_failure("http://primary")
+
+    results = await asyncio.gather(*(pool.get_candidates() for _ in range(5)))
+
+    assert probes == ["http://primary"]
+    assert all(entry.base_url == "http://primary" for (_client, entry), *_rest in results)
+    await pool.aclose()
+
+
+def test_nodepool_sync_candidates_defers_when_probe_needed():
+    from qortal_mcp.qortal_api.client import NodePool
+
+    pool = NodePool(["http://primary", "http://fallback"], timeout=1, cooldown_seconds=0)
+    assert [entry.base_url for _client, entry in pool.get_candidates_sync()] == [
+        "http://primary",
+        "http://fallback",
+    ]
+
+    probing = NodePool(
+        ["http://primary", "http://fallback"],
+        timeout=1,
+        cooldown_seconds=0,
+        health_check_path="/blocks/height",
+    )
+    probing.report_failure("http://primary")
+    assert probing.get_candidates_sync() is None
+
+
+def test_nodepool_cooldown_uses_supplied_timestamp():
+    from qortal_mcp.qortal_api.client import NodePool
+
+    pool = NodePool(["http://primary", "http://fallback"], timeout=1, cooldown_seconds=30)
+    pool.report_failure("http://primary", now=100.0)
+    entry = pool._by_url["http://primary"]
+    assert entry.last_failure == 100.0
+    assert pool._in_cooldown(entry, 129.0)
+    assert not pool._in_cooldown(entry, 130.0)
+    pool.report_success("http://primary")
+    assert not pool._in_cooldown(entry, 100.0)
+
+
+@pytest.mark.asyncio
+async def test_single_node_client_is_created_once_and_reused(monkeypatch):
+    created = []
+
+    def factory(base_url, timeout, **kwargs):
+        created.append(kwargs)
+        return DummyAsyncClient(base_url, timeout, lambda *_args: DummyResponse(200, {"ok": True}))
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+
+    client = QortalApiClient(config=QortalConfig(base_url="http://primary", response_cache_size=0))
+    for _ in range(3):
+        await client.fetch_node_status()
+    assert len(created) == 1
+    assert created[0]["limits"].keepalive_expiry == client.config.http_keepalive_expiry
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_http2_requested_only_when_enabled_and_available(monkeypatch):
+    from qortal_mcp.qortal_api import client as client_module
+
+    created = []
+
+    def factory(base_url, timeout, **kwargs):
+        created.append(kwargs)
+        return DummyAsyncClient(base_url, timeout, lambda *_args: DummyResponse(200, {"ok": True}))
+
+    monkeypatch.setattr(httpx, "AsyncClient", factory)
+    monkeypatch.setattr(client_module, "_HTTP2_AVAILABLE", True)
+
+    for enabled in (True, False):
+        client = QortalApiClient(config=QortalConfig(base_url="https://node", http2=enabled))
+        await client.fetch_node_status()
+        await client.aclose()
+    assert [kwargs["http2"] for kwargs in created] == [True, False]
+
+    monkeypatch.setattr(client_module, "_HTTP2_AVAILABLE", False)
+    client = QortalApiClient(config=QortalConfig(base_url="https://node", http2=True))
+    await client.fetch_node_status()
+    await client.aclose()
+    assert created[-1]["http2"] is False
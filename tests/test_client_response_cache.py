@@ -0,0 +1,217 @@
+import asyncio
+
+import pytest
+
+from qortal_mcp.config import QortalConfig
+from qortal_mcp.qortal_api import cache as cache_module
+from qortal_mcp.qortal_api.client import QortalApiClient
+
+
+class MockResponse:
+    def __init__(self, status_code: int, json_body=None):
+        self.status_code = status_code
+        self._json = json_body
+        self.text = ""
+
+    def json(self):
+        if self._json is None:
+            raise ValueError("no json")
+        return self._json
+
+
+class CountingAsyncClient:
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    async def get(self, path, params=None, headers=None):
+        self.calls.append((path, params))
+        return MockResponse(200, self.body)
+
+    async def aclose(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_repeated_name_lookup_served_from_memory():
+    mock = CountingAsyncClient({"name": "alice", "owner": "Q1"})
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+
+    first = await client.fetch_name_info("alice")
+    first["owner"] = "mutated"
+    second = await client.fetch_name_info("alice")
+
+    assert len(mock.calls) == 1
+    assert second == {"name": "alice", "owner": "Q1"}
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_refetch(monkeypatch):
+    now = {"t": 100.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["t"])
+    mock = CountingAsyncClient({"height": 1})
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+
+    await client.fetch_node_status()
+    await client.fetch_node_status()
+    assert len(mock.calls) == 1
+
+    now["t"] += 5
+    await client.fetch_node_status()
+    assert len(mock.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_paths_and_disabled_cache_always_hit_node():
+    mock = CountingAsyncClient([])
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+    await client.fetch_groups(limit=1)
+    await client.fetch_groups(limit=1)
+    assert len(mock.calls) == 2
+
+    mock = CountingAsyncClient({"name": "alice"})
+    client = QortalApiClient(config=QortalConfig(response_cache_size=0), async_client=mock)
+    await client.fetch_name_info("alice")
+    await client.fetch_name_info("alice")
+    assert len(mock.calls) == 2
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = cache_module.TTLCache(max_size=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, 60)
+    assert cache.get("b") is cache_module.MISS
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    class GatedAsyncClient(CountingAsyncClient):
+        def __init__(self, body):
+            super().__init__(body)
+            self.release = asyncio.Event()
+
+        async def get(self, path, params=None, headers=None):
+            self.calls.append((path, params))
+            await self.release.wait()
+            return MockResponse(200, self.body)
+
+    mock = GatedAsyncClient([{"signature": "s1"}])
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+
+    callers = [asyncio.ensure_future(client.fetch_groups(limit=5)) for _ in range(5)]
+    await asyncio.sleep(0)
+    mock.release.set()
+    results = await asyncio.gather(*callers)
+
+    assert len(mock.calls) == 1
+    assert all(result == [{"signature": "s1"}] for result in results)
+    assert results[0] is not results[1]
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_first_caller_mutation_does_not_leak_to_joined_callers():
+    class GatedAsyncClient(CountingAsyncClient):
+        def __init__(self, body):
+            super().__init__(body)
+            self.release = asyncio.Event()
+
+        async def get(self, path, params=None, headers=None):
+            self.calls.append((path, params))
+            await self.release.wait()
+            return MockResponse(200, self.body)
+
+    mock = GatedAsyncClient([{"assetId": 1}])
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+
+    async def first_caller():
+        result = await client.fetch_groups(limit=5)
+        result[0]["name"] = "mutated"
+        return result
+
+    leader = asyncio.ensure_future(first_caller())
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(client.fetch_groups(limit=5))
+    await asyncio.sleep(0)
+    mock.release.set()
+    await leader
+
+    assert await follower == [{"assetId": 1}]
+    assert len(mock.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_result_copied_only_when_a_caller_joined(monkeypatch):
+    from qortal_mcp.qortal_api import client as client_module
+
+    copies = []
+    real_deepcopy = client_module.copy.deepcopy
+
+    def counting_deepcopy(value, *args):
+        copies.append(value)
+        return real_deepcopy(value, *args)
+
+    monkeypatch.setattr(client_module.copy, "deepcopy", counting_deepcopy)
+
+    class GatedAsyncClient(CountingAsyncClient):
+        def __init__(self, body):
+            super().__init__(body)
+            self.release = asyncio.Event()
+
+        async def get(self, path, params=None, headers=None):
+            self.calls.append((path, params))
+            await self.release.wait()
+            return MockResponse(200, self.body)
+
+    mock = GatedAsyncClient([{"signature": "s1"}])
+    client = QortalApiClient(config=QortalConfig(response_cache_size=0), async_client=mock)
+
+    mock.release.set()
+    assert await client.fetch_groups(limit=5) == [{"signature": "s1"}]
+    assert copies == []
+
+    mock.release.clear()
+    callers = [asyncio.ensure_future(client.fetch_groups(limit=5)) for _ in range(2)]
+    await asyncio.sleep(0)
+    mock.release.set()
+    first, second = await asyncio.gather(*callers)
+    assert len(copies) == 2
+    assert first == second and first is not second
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_abort_shared_request():
+    class GatedAsyncClient(CountingAsyncClient):
+        def __init__(self, body):
+            super().__init__(body)
+            self.release = asyncio.Event()
+
+        async def get(self, path, params=None, headers=None):
+            self.calls.append((path, params))
+            await self.release.wait()
+            return MockResponse(200, self.body)
+
+    mock = GatedAsyncClient([])
+    client = QortalApiClient(config=QortalConfig(), async_client=mock)
+
+    first = asyncio.ensure_future(client.fetch_groups())
+    second = asyncio.ensure_future(client.fetch_groups())
+    await asyncio.sleep(0)
+    first.cancel()
+    mock.release.set()
+
+    assert await second == []
+    assert len(mock.calls) == 1
+
+
+def test_group_and_asset_ttls():
+    assert cache_module.response_ttl("/assets/info") == 60.0
+    assert cache_module.response_ttl("/groups/5") == 30.0
+    assert cache_module.response_ttl("/groups/owner/Q1") == 30.0
+    assert cache_module.response_ttl("/groups/member/Q1") == 30.0
+    for path in ("/groups/members/5", "/groups/invites/Q1", "/groups/joinrequests/5", "/groups/bans/5", "/groups"):
+        assert cache_module.response_ttl(path) == 0.0
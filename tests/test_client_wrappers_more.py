@@ -47,7 +47,7 @@ async def test_wrapper_methods_success_paths():
         MockResponse(200, json_body={"data": "d"}),  # fetch_chat_message
         MockResponse(200, json_body={"direct": [{"address": "Q" * 34}]}),  # fetch_active_chats
         MockResponse(200, json_body=[{"groupId": 1}]),  # fetch_groups
-        MockResponse(200, json_body=None, text_body="42"),  # fetch_block_height_by_signature
+        MockResponse(200, json_body=42),  # fetch_block_height_by_signature
         MockResponse(404, json_body={"error": "BLOCK_UNKNOWN"}),  # fetch_block_by_signature
         MockResponse(200, json_body=[{"groupId": 2}]),  # fetch_groups_by_owner
     ]
@@ -73,3 +73,80 @@ async def test_wrapper_methods_success_paths():
     with pytest.raises(Exception):
         await client.fetch_block_by_signature("s" * 44)
     assert await client.fetch_groups_by_owner("Q" * 34) == [{"groupId": 2}]
+
+
+@pytest.mark.asyncio
+async def test_param_specs_skip_unset_and_empty_values():
+    mac = MockAsyncClient([MockResponse(200, json_body=[]), MockResponse(200, json_body=[])])
+    client = QortalApiClient(async_client=mac)
+
+    await client.search_transactions(tx_types=[], address="", start_block=0, reverse=False)
+    assert mac.calls[0]["params"] == {"startBlock": 0, "reverse": False}
+
+    await client.fetch_completed_trades(foreign_blockchain="LITECOIN", limit=3)
+    assert mac.calls[1]["params"] == {"foreignBlockchain": "LITECOIN", "limit": 3}
+
+
+@pytest.mark.asyncio
+async def test_optional_params_are_none_when_unset():
+    mac = MockAsyncClient([MockResponse(200, json_body=[]) for _ in range(3)])
+    client = QortalApiClient(async_client=mac)
+
+    await client.fetch_groups()
+    await client.fetch_hidden_trade_offers(foreign_blockchain="")
+    await client.fetch_trade_price(blockchain="LITECOIN", inverse=True)
+    assert [call["params"] for call in mac.calls] == [None, None, {"inverse": True}]
+
+
+@pytest.mark.asyncio
+async def test_path_wrappers_build_paths_and_accept_keywords():
+    mac = MockAsyncClient([MockResponse(200, json_body={}) for _ in range(4)])
+    client = QortalApiClient(async_client=mac)
+
+    await client.fetch_name_info("a b/c")
+    await client.fetch_group(group_id=7)
+    await client.fetch_minting_info_by_height(height=12)
+    await client.fetch_address_info(address="QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV")
+    assert [call["path"] for call in mac.calls] == [
+        "/names/a%20b%2Fc",
+        "/groups/7",
+        "/blocks/byheight/12/mintinginfo",
+        "/addresses/QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV",
+    ]
+    assert QortalApiClient.fetch_group.__doc__ == "Fetch group details by id."
+
+
+@pytest.mark.asyncio
+async def test_list_param_specs_match_wire_names():
+    mac = MockAsyncClient(
+        [
+            MockResponse(200, json_body=[]),
+            MockResponse(200, json_body=[]),
+            MockResponse(200, json_body=None, text_body="0"),
+            MockResponse(200, json_body=[]),
+        ]
+    )
+    client = QortalApiClient(async_client=mac)
+
+    await client.fetch_asset_balances(addresses=["Q1"], asset_ids=[], exclude_zero=False, limit=2)
+    await client.search_qdn(limit=5, service="", name="", tx_group_id=0)
+    await client.count_chat_messages(involving=["Q1", "Q2"], chat_reference="", has_chat_reference=True)
+    await client.fetch_chat_messages()
+    assert [call["params"] for call in mac.calls] == [
+        {"address": ["Q1"], "excludeZero": False, "limit": 2},
+        {"limit": 5, "service": "", "txGroupId": 0},
+        {"involving": ["Q1", "Q2"], "haschatreference": True},
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_count_chat_messages_parses_padded_text():
+    mac = MockAsyncClient(
+        [MockResponse(200, json_body=None, text_body=" 12\n"), MockResponse(200, json_body=None, text_body="n/a")]
+    )
+    client = QortalApiClient(async_client=mac)
+
+    assert await client.count_chat_messages() == 12
+    with pytest.raises(Exception, match="Unexpected response"):
+        await client.count_chat_messages()
@@ -9,6 +9,7 @@ def test_health_endpoint():
     assert resp.status_code == 200
     assert resp.json().get("status") == "ok"
     assert resp.headers.get("X-Request-ID")
+    assert resp.headers["content-type"] == "application/json"
 
 
 def test_metrics_endpoint_counts_requests():
@@ -25,8 +25,9 @@ def test_rate_limit_mcp_list_tools(client, monkeypatch):
     monkeypatch.setattr(server_mod.rate_limiter, "allow", deny)
     resp = client.post("/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "list_tools"})
     assert resp.status_code == 429
+    assert resp.headers["content-type"] == "application/json"
     body = resp.json()
-    assert body["error"]["message"] == "Rate limit exceeded"
+    assert body == {"jsonrpc": "2.0", "error": {"code": 429, "message": "Rate limit exceeded"}}
 
 
 def test_metrics_increments_requests(client):
@@ -0,0 +1,27 @@
+import pytest
+
+from qortal_mcp import json_codec
+
+
+def test_loads_bytes_and_text():
+    assert json_codec.loads(b'{"height": 12}') == {"height": 12}
+    assert json_codec.loads('[1, "a"]') == [1, "a"]
+
+
+def test_loads_falls_back_for_stdlib_only_inputs():
+    big = 2**70
+    assert json_codec.loads(str(big).encode()) == big
+
+
+def test_loads_invalid_raises_value_error():
+    with pytest.raises(ValueError):
+        json_codec.loads(b"<html>")
+
+
+def test_dumps_matches_stdlib_layout():
+    payload = {"name": "Qortal \u00e9", 5: [1, None, True]}
+    assert json_codec.dumps(payload) == '{"name":"Qortal \u00e9","5":[1,null,true]}'.encode()
+
+
+def test_dumps_falls_back_for_wide_integers():
+    assert json_codec.dumps({"big": 2**70}) == b'{"big":1180591620717411303424}'
@@ -12,3 +12,40 @@ def test_logging_level_config():
         logging.ERROR,
         logging.CRITICAL,
     )
+
+
+def test_json_formatter_includes_extras_only_when_present():
+    import json
+
+    from qortal_mcp.server import JsonFormatter
+
+    formatter = JsonFormatter()
+    record = logging.LogRecord("qortal", logging.INFO, __file__, 1, "tool=%s ok", ("get_balance",), None)
+    assert json.loads(formatter.format(record)) == {"level": "INFO", "message": "tool=get_balance ok", "name": "qortal"}
+
+    record.tool = "get_balance"
+    record.request_id = "1-2-3"
+    line = formatter.format(record)
+    assert json.loads(line)["tool"] == "get_balance"
+    assert json.loads(line)["request_id"] == "1-2-3"
+    assert "error" not in json.loads(line)
+
+
+def test_json_formatter_output_stays_ascii():
+    from qortal_mcp.server import JsonFormatter
+
+    record = logging.LogRecord("qortal", logging.WARNING, __file__, 1, "name=%s", ("café",), None)
+    line = JsonFormatter().format(record)
+    assert line.isascii()
+    assert "caf\\u00e9" in line
+
+
+def test_json_formatter_uses_one_compact_layout():
+    from qortal_mcp.server import JsonFormatter
+
+    formatter = JsonFormatter()
+    ascii_record = logging.LogRecord("qortal", logging.WARNING, __file__, 1, "name=%s", ("cafe",), None)
+    non_ascii_record = logging.LogRecord("qortal", logging.WARNING, __file__, 1, "name=%s", ("café",), None)
+
+    assert formatter.format(ascii_record) == '{"level":"WARNING","message":"name=cafe","name":"qortal"}'
+    assert formatter.format(non_ascii_record) == '{"level":"WARNING","message":"name=caf\\u00e9","name":"qortal"}'
@@ -6,3 +6,16 @@ def test_log_tool_result_handles_non_dict():
     _log_tool_result("dummy", {"ok": True})
     _log_tool_result("dummy", {"error": "fail"})
     _log_tool_result("dummy", None)  # type: ignore[arg-type]
+
+
+def test_log_tool_result_records_metrics_when_logging_filtered(monkeypatch):
+    from qortal_mcp import server as server_mod
+    from qortal_mcp.metrics import default_metrics
+
+    default_metrics.reset()
+    monkeypatch.setattr(server_mod.logger, "disabled", True)
+    _log_tool_result("dummy", {"ok": True})
+    _log_tool_result("dummy", {"error": "fail"})
+    snapshot = default_metrics.snapshot()
+    assert snapshot["tool_success"] == {"dummy": 1}
+    assert snapshot["tool_error"] == {"dummy": 1}
@@ -1,3 +1,4 @@
+import pytest
 from fastapi.testclient import TestClient
 
 from qortal_mcp.server import app
@@ -40,3 +41,61 @@ def test_mcp_initialize():
     assert result["protocolVersion"] == "2025-03-26"
     assert "serverInfo" in result
     assert "capabilities" in result
+
+
+def test_wrap_tool_result_text_is_compact_ascii_json():
+    from qortal_mcp.server import _wrap_tool_result
+
+    wrapped = _wrap_tool_result({"name": "café", "count": 2})
+    assert wrapped["content"][0]["text"] == '{"name":"caf\\u00e9","count":2}'
+    assert wrapped["structuredContent"] == {"name": "café", "count": 2}
+
+
+def test_mcp_malformed_body_is_parse_error():
+    resp = client.post("/mcp", content=b"{not json", headers={"content-type": "application/json"})
+    assert resp.status_code == 400
+    body = resp.json()
+    assert body["id"] is None
+    assert body["error"]["code"] == -32700
+
+
+def test_mcp_unknown_or_non_string_method_is_not_found():
+    for method in ("resources/list", ["tools/list"]):
+        resp = client.post("/mcp", json={"jsonrpc": "2.0", "id": 7, "method": method})
+        assert resp.status_code == 200
+        assert resp.json()["error"]["code"] == -32601
+
+
+def test_mcp_initialized_notification_has_no_body():
+    for method in ("notifications/initialized", "initialized"):
+        resp = client.post("/mcp", json={"jsonrpc": "2.0", "method": method})
+        assert resp.status_code == 204
+        assert resp.content == b""
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {"isValid": True, "address": "Q1"},
+        [{"name": "café"}, {"name": "n2"}],
+        {"error": "Invalid address."},
+        "plain text",
+        7,
+    ],
+)
+def test_tool_result_body_matches_wrapped_payload(result):
+    from qortal_mcp import json_codec
+    from qortal_mcp.server import _jsonrpc_success_payload, _tool_result_body, _wrap_tool_result
+
+    expected = json_codec.dumps(_jsonrpc_success_payload("id-1", _wrap_tool_result(result)))
+    assert _tool_result_body("id-1", result) == expected
+
+
+def test_tools_list_matches_registry():
+    from qortal_mcp import mcp
+
+    for method in ("list_tools", "tools/list"):
+        resp = client.post("/mcp", json={"jsonrpc": "2.0", "id": {"n": 1}, "method": method})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"jsonrpc": "2.0", "id": {"n": 1}, "result": {"tools": mcp.list_tools()}}
@@ -26,3 +26,55 @@ async def test_per_tool_override():
     fast = limiter._limiters["fast_tool"]
     assert slow.bucket.rate == pytest.approx(0.1)
     assert fast.bucket.rate == pytest.approx(10)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_limiter():
+    limiter = PerKeyRateLimiter(rate_per_sec=1, burst=2)
+    results = await asyncio.gather(*(limiter.allow("tool") for _ in range(4)))
+    assert results.count(True) == 2
+    assert list(limiter._limiters) == ["tool"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_at_rate(monkeypatch):
+    from qortal_mcp import rate_limiter
+
+    clock = [100_000_000_000]
+    monkeypatch.setattr(rate_limiter.time, "monotonic_ns", lambda: clock[0])
+    bucket = rate_limiter.TokenBucket(rate=2, capacity=3)
+    assert [await bucket.consume() for _ in range(4)] == [True, True, True, False]
+    clock[0] += 500_000_000
+    assert await bucket.consume()
+    assert not await bucket.consume()
+    clock[0] += 10_000_000_000
+    assert [await bucket.consume() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_per_key_limiter_evicts_least_recently_used():
+    limiter = PerKeyRateLimiter(rate_per_sec=1, burst=1, max_keys=2)
+    assert await limiter.allow("a")
+    assert await limiter.allow("b")
+    assert not await limiter.allow("a")  # refreshes "a"
+    assert await limiter.allow("c")  # evicts "b"
+    assert list(limiter._limiters) == ["a", "c"]
+
+
+def test_try_allow_shares_buckets_with_allow():
+    limiter = PerKeyRateLimiter(rate_per_sec=1, burst=2)
+    assert limiter.try_allow("tool")
+    assert asyncio.run(limiter.allow("tool"))
+    assert not limiter.try_allow("tool")
+
+
+def test_zero_rate_allows_burst_then_never_refills(monkeypatch):
+    from qortal_mcp import rate_limiter
+
+    clock = [100_000_000_000]
+    monkeypatch.setattr(rate_limiter.time, "monotonic_ns", lambda: clock[0])
+    limiter = PerKeyRateLimiter(rate_per_sec=5, burst=2, per_tool={"x": 0})
+    assert [limiter.try_allow("x") for _ in range(3)] == [True, True, False]
+    clock[0] += 3600 * 1_000_000_000
+    assert not limiter.try_allow("x")
+    assert limiter.try_allow("y")
@@ -21,6 +21,14 @@ def test_request_ids_on_routes_and_mcp():
     assert body.get("id") == 99
 
 
+def test_request_ids_are_unique_per_process():
+    client = TestClient(app)
+    first = client.get("/health").headers["X-Request-ID"]
+    second = client.get("/health").headers["X-Request-ID"]
+    assert first != second
+    assert first.rsplit("-", 1)[0] == second.rsplit("-", 1)[0]
+
+
 def test_rate_limit_increments_metrics(monkeypatch):
     client = TestClient(app)
 
@@ -64,3 +72,12 @@ async def test_api_key_header_is_sent(monkeypatch):
     client = QortalApiClient(config=cfg.default_config, async_client=HeaderCaptureClient())
     await client.fetch_node_status()
     assert sent_headers.get("X-API-KEY") == "secret-key"
+
+
+def test_recent_durations_are_bounded():
+    from qortal_mcp.metrics import MetricsRecorder
+
+    recorder = MetricsRecorder(recent_durations=3)
+    for index in range(5):
+        recorder.record_duration(f"req-{index}", float(index))
+    assert recorder.snapshot()["recent_request_durations_ms"] == {"req-2": 2.0, "req-3": 3.0, "req-4": 4.0}
@@ -39,6 +39,9 @@ def test_chat_messages_route_success(monkeypatch, client):
     body = resp.json()
     assert isinstance(body, list)
     assert body[0]["signature"] == "s"
+    assert body[0]["filters"]["tx_group_id"] == 1
+    assert body[0]["filters"]["decode_text"] is True
+    assert body[0]["filters"]["chat_reference"] is None
 
 
 def test_qdn_search_route_error(monkeypatch, client):
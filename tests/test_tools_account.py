@@ -50,12 +50,102 @@ async def test_account_overview_happy_path():
     assert result["level"] == 2
 
 
+@pytest.mark.asyncio
+async def test_account_overview_lookups_run_concurrently():
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    class StubClient:
+        async def _wait(self, name):
+            started.append(name)
+            if len(started) == 3:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+
+        async def fetch_address_info(self, address):
+            await self._wait("info")
+            return {"address": address}
+
+        async def fetch_address_balance(self, address, asset_id=0):
+            await self._wait("balance")
+            return {"balance": "2"}
+
+        async def fetch_names_by_owner(self, address):
+            await self._wait("names")
+            return ["n"]
+
+    result = await get_account_overview("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", client=StubClient())
+    assert sorted(started) == ["balance", "info", "names"]
+    assert result["balance"] == "2"
+    assert result["names"] == ["n"]
+
+
+@pytest.mark.asyncio
+async def test_account_overview_asset_lookup_runs_with_account_lookups():
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    class StubClient:
+        async def _wait(self, name):
+            started.append(name)
+            if len(started) == 4:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+
+        async def fetch_address_info(self, address):
+            await self._wait("info")
+            return {"address": address}
+
+        async def fetch_address_balance(self, address, asset_id=0):
+            await self._wait("balance")
+            return {"balance": "2"}
+
+        async def fetch_names_by_owner(self, address):
+            await self._wait("names")
+            return []
+
+        async def fetch_asset_balances(self, **kwargs):
+            await self._wait("assets")
+            return [{"assetId": 1, "balance": "5"}]
+
+        async def fetch_asset_info(self, asset_id=None, asset_name=None):
+            return {"name": f"ASSET-{asset_id}"}
+
+    result = await get_account_overview(
+        "QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", include_assets=True, client=StubClient()
+    )
+    assert sorted(started) == ["assets", "balance", "info", "names"]
+    assert result["assetBalances"] == [{"assetId": 1, "balance": "5", "name": "ASSET-1"}]
+
+
+@pytest.mark.asyncio
+async def test_account_overview_invalid_asset_ids_skip_calls():
+    class FailClient:
+        def __getattr__(self, name):
+            pytest.fail(f"{name} should not be called for invalid asset_ids")
+
+    result = await get_account_overview(
+        "QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", include_assets=True, asset_ids=["x"], client=FailClient()
+    )
+    assert result == {"error": "Invalid asset_ids; must be 1 to 10 integers."}
+
+
 @pytest.mark.asyncio
 async def test_account_overview_error_mapping():
     class StubClient:
         async def fetch_address_info(self, *_args, **_kwargs):
             raise AddressNotFoundError("unknown")
 
+        async def fetch_address_balance(self, address, asset_id=0):
+            return {"balance": "1"}
+
+        async def fetch_names_by_owner(self, address):
+            return []
+
     result = await get_account_overview("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", client=StubClient())
     assert result == {"error": "Address not found on chain."}
 
@@ -66,6 +156,12 @@ async def test_account_overview_unreachable():
         async def fetch_address_info(self, *_args, **_kwargs):
             raise NodeUnreachableError("down")
 
+        async def fetch_address_balance(self, address, asset_id=0):
+            raise NodeUnreachableError("down")
+
+        async def fetch_names_by_owner(self, address):
+            raise NodeUnreachableError("down")
+
     result = await get_account_overview("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", client=StubClient())
     assert result == {"error": "Node unreachable"}
 
@@ -171,6 +267,48 @@ async def test_account_overview_include_assets_top_n():
     assert overview["assetBalances"][0]["name"] == "ASSET-1"
 
 
+@pytest.mark.asyncio
+async def test_account_overview_top_n_names_resolve_concurrently():
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    class StubClient:
+        async def fetch_address_info(self, address):
+            return {"address": address}
+
+        async def fetch_address_balance(self, address, asset_id=0):
+            return {"balance": "1.0"}
+
+        async def fetch_names_by_owner(self, address):
+            return []
+
+        async def fetch_asset_balances(self, **kwargs):
+            return [{"assetId": 1, "balance": "5"}, {"assetId": 2, "balance": "4"}]
+
+        async def fetch_asset_info(self, asset_id=None, asset_name=None):
+            started.append(asset_id)
+            if len(started) == 2:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+            if asset_id == 2:
+                raise QortalApiError("missing")
+            return {"name": f"ASSET-{asset_id}"}
+
+    overview = await get_account_overview(
+        "QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV",
+        include_assets=True,
+        client=StubClient(),
+        config=QortalConfig(max_asset_overview=3, default_asset_overview=2),
+    )
+    assert sorted(started) == [1, 2]
+    assert overview["assetBalances"] == [
+        {"assetId": 1, "balance": "5", "name": "ASSET-1"},
+        {"assetId": 2, "balance": "4"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_account_overview_asset_ids_invalid():
     overview = await get_account_overview("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", include_assets=True, asset_ids="bad")
@@ -225,6 +363,44 @@ async def test_account_overview_asset_not_found_entry():
     assert overview["assetBalances"] == [{"assetId": 123, "error": "Asset not found."}]
 
 
+@pytest.mark.asyncio
+async def test_account_overview_explicit_asset_lookups_run_concurrently():
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    class StubClient:
+        async def fetch_address_info(self, address):
+            return {"address": address}
+
+        async def fetch_address_balance(self, address, asset_id=0):
+            if asset_id == 0:
+                return {"balance": "1.0"}
+            started.append(asset_id)
+            if len(started) == 3:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+            if asset_id == 2:
+                raise NodeUnreachableError("down")
+            return {"balance": str(asset_id)}
+
+        async def fetch_names_by_owner(self, address):
+            return []
+
+        async def fetch_asset_info(self, asset_id=None, asset_name=None):
+            return {"name": f"ASSET-{asset_id}"}
+
+    overview = await get_account_overview(
+        "QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV",
+        include_assets=True,
+        asset_ids=[3, 1, 2],
+        client=StubClient(),
+    )
+    assert sorted(started) == [1, 2, 3]
+    assert overview["assetBalances"] == [{"error": "Node unreachable"}]
+
+
 @pytest.mark.asyncio
 async def test_get_balance_happy_path():
     class StubClient:
@@ -286,6 +462,7 @@ def test_extract_names_variants():
     assert _extract_names({"names": [{"name": "a"}, {"name": "b"}]}, 5) == ["a", "b"]
     assert _extract_names(["x", {"name": "y"}], 2) == ["x", "y"]
     assert _extract_names("not-list", 2) == []
+    assert _extract_names([1, "a", {"name": 2}, "b", "c"], 4) == ["a", "b"]
 
 
 @pytest.mark.asyncio
@@ -329,5 +506,8 @@ async def test_account_overview_balance_unexpected_error():
         async def fetch_address_balance(self, address, asset_id=0):
             raise Exception("boom")
 
+        async def fetch_names_by_owner(self, address):
+            return []
+
     result = await get_account_overview("QgB7zMfujQMLkisp1Lc8PBkVYs75sYB3vV", client=StubClient())
     assert result == {"error": "Unexpected error while retrieving account balance."}
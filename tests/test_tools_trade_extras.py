@@ -90,15 +90,16 @@ async def test_get_trade_ledger_validation_and_errors():
     assert result == {"error": "Public key is required."}
 
     class StubClient:
-        async def fetch_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
-            return "csv"
+        async def stream_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
+            yield "csv"
 
     ledger = await get_trade_ledger(public_key="A" * 44, client=StubClient())
     assert ledger == {"ledger": "csv"}
 
     class FailClient:
-        async def fetch_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
+        async def stream_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
             raise NodeUnreachableError("down")
+            yield
 
     assert await get_trade_ledger(public_key="A" * 44, client=FailClient()) == {"error": "Node unreachable"}
 
@@ -196,3 +197,50 @@ async def test_list_completed_trades_validation_and_success():
     )
     assert len(trades) == 2
     assert trades[0]["tradeAddress"] == "A1"
+
+
+@pytest.mark.asyncio
+async def test_get_trade_ledger_truncates_long_ledgers():
+    closed = []
+
+    class StubClient:
+        async def stream_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
+            try:
+                yield "header\r\n"
+                for i in range(10):
+                    yield f"row{i}\r\n"
+            finally:
+                closed.append(True)
+
+    cfg = QortalConfig(max_trade_ledger_lines=3)
+    ledger = await get_trade_ledger(public_key="A" * 44, client=StubClient(), config=cfg)
+    assert ledger == {"ledger": "header\r\nrow0\r\nrow1\r\n", "truncated": True}
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_get_trade_ledger_returns_body_verbatim():
+    class StubClient:
+        def __init__(self, chunks):
+            self.chunks = chunks
+
+        async def stream_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
+            for chunk in self.chunks:
+                yield chunk
+
+    cfg = QortalConfig(max_trade_ledger_lines=3)
+    ledger = await get_trade_ledger(public_key="A" * 44, client=StubClient(["a,b\r\n1,", "2\r\n3,4\r\n"]), config=cfg)
+    assert ledger == {"ledger": "a,b\r\n1,2\r\n3,4\r\n"}
+
+    ledger = await get_trade_ledger(public_key="A" * 44, client=StubClient(["a,b\n1,2\n3,4\n", "", "5,6"]), config=cfg)
+    assert ledger == {"ledger": "a,b\n1,2\n3,4\n", "truncated": True}
+
+
+@pytest.mark.asyncio
+async def test_get_trade_ledger_maps_mid_stream_api_error():
+    class StubClient:
+        async def stream_trade_ledger(self, *, public_key: str, minimum_timestamp=None):
+            yield "a,b\n"
+            raise QortalApiError("bad ledger")
+
+    assert await get_trade_ledger(public_key="A" * 44, client=StubClient()) == {"error": "Qortal API error."}